@@ -90,6 +90,8 @@ class Settings(BaseSettings):
     # Base Chain Configuration
     base_rpc_url: str = Field(..., env="BASE_RPC_URL")
     chain_id: int = Field(default=8453, env="CHAIN_ID")
+    rpc_max_concurrency: int = Field(default=8, env="RPC_MAX_CONCURRENCY")  # Max in-flight RPC reads
+    balance_cache_ttl: float = Field(default=5.0, env="BALANCE_CACHE_TTL")  # Seconds a wallet balances snapshot is reused
     
     @property
     def cdp_rpc_url(self) -> str:
@@ -166,10 +168,12 @@ class Settings(BaseSettings):
     min_volume_for_memory: int = Field(default=100000, env="MIN_VOLUME_FOR_MEMORY")  # Store pools with volume >= $100k
     max_memories_per_cycle: int = Field(default=50, env="MAX_MEMORIES_PER_CYCLE")  # Prevent memory overflow
     pool_profile_update_interval: int = Field(default=3600, env="POOL_PROFILE_UPDATE_INTERVAL")  # Update profiles every hour
+    pool_scan_timeout: float = Field(default=30.0, env="POOL_SCAN_TIMEOUT")  # Max seconds per pool scan
     
     # QuickNode API Configuration
     quicknode_api_key: Optional[str] = Field(None, env="QUICKNODE_API_KEY")
     quicknode_endpoint: Optional[str] = Field(None, env="QUICKNODE_ENDPOINT")
+    quicknode_rate_limit: int = Field(default=300, env="QUICKNODE_RATE_LIMIT")  # Max requests per minute
     
     @validator("quicknode_api_key", pre=False, always=True)
     def load_quicknode_api_key(cls, v, values):
@@ -275,4 +279,8 @@ EMOTIONAL_STATES = {
     "cautious": {"threshold": 0.5, "description": "Mixed results, being careful"},
     "curious": {"threshold": 0.3, "description": "Exploring new strategies"},
     "learning": {"threshold": 0.0, "description": "Gathering data"},
-}
\ No newline at end of file
+}
+
+
+# Day names indexed by datetime.weekday(); matches strftime("%A") without the locale lookup
+DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
\ No newline at end of file
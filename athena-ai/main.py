@@ -1,8 +1,9 @@
 # main.py
 import asyncio
+import copy
 import logging
 import os
-from datetime import datetime, timedelta
+from datetime import datetime
 from src.agent.core import AthenaAgent
 from src.agent.memory import AthenaMemory
 from src.cdp.base_client import BaseClient
@@ -60,8 +61,40 @@ async def main():
     asyncio.create_task(gas_monitor.start_monitoring())
     asyncio.create_task(pool_scanner.start_scanning())
     
+    # In-flight Firestore writes, drained on shutdown
+    pending_writes = set()
+    
+    def persist(func, *args, **kwargs) -> asyncio.Task:
+        """Run a Firestore write in the background."""
+        task = asyncio.create_task(func(*args, **kwargs))
+        pending_writes.add(task)
+        task.add_done_callback(pending_writes.discard)
+        return task
+    
     # Run agent reasoning loop
+    try:
+        await _reasoning_loop(agent, firestore, persist)
+    finally:
+        if pending_writes:
+            await asyncio.gather(*pending_writes, return_exceptions=True)
+        await agent.pool_profiles.close()
+        await base_client.close()
+
+
+async def _reasoning_loop(agent: AthenaAgent, firestore: FirestoreClient, persist):
+    """Run the agent reasoning loop forever."""
     cycle_count = 0
+    # Last performance summary committed, so unchanged stats aren't rewritten every cycle
+    saved_performance = None
+    
+    def mark_saved(performance):
+        """Done-callback that records performance as stored once its commit succeeds."""
+        def callback(task: asyncio.Task):
+            nonlocal saved_performance
+            if not task.cancelled() and task.exception() is None and task.result():
+                saved_performance = performance
+        return callback
+        
     while True:
         cycle_count += 1
         logger.info(f"🔄 Starting reasoning cycle #{cycle_count}")
@@ -82,49 +115,69 @@ async def main():
             # Execute workflow
             result = await agent.graph.ainvoke(state)
             
-            # Save to Firestore
-            firestore.save_agent_state({
-                'cycle_count': cycle_count,
-                'emotions': agent.emotions,
-                'performance': agent.performance,
-                'status': 'observing' if agent._is_observation_mode() else 'active',
-                'observation_mode': agent._is_observation_mode()
-            })
-            
-            firestore.save_cycle_result(cycle_count, {
-                'observations': result.get('observations', []),
-                'theories': result.get('theories', []),
-                'decisions': result.get('decisions', []),
-                'next_action': result.get('next_action', ''),
-                'observation_mode': agent._is_observation_mode()
-            })
-            
-            firestore.update_performance(agent.performance)
+            # Evaluate the mode once per cycle
+            observing = agent._is_observation_mode()
             
             # Track observation metrics
-            if agent._is_observation_mode():
-                firestore.save_observation_metrics({
+            observation_metrics = None
+            if observing:
+                observation_metrics = {
                     'patterns_discovered': len(agent.patterns_discovered),
                     'cycles_completed': cycle_count,
                     'unique_theories': len(set(result.get('theories', []))),
                     'observations_collected': len(result.get('observations', [])),
-                    'start_time': agent.observation_start.isoformat(),
+                    'start_time': agent.observation_start,
                     'days_observed': (datetime.utcnow() - agent.observation_start).days
-                })
+                }
+            
+            # Only flush the performance summary when it differs from the last
+            # committed one; a failed write leaves it pending for the next cycle
+            performance = None
+            if agent.performance != saved_performance:
+                performance = copy.deepcopy(agent.performance)
+            
+            # Agent state is merged, so performance is only embedded when the
+            # summary is resent. Both go in the same batch, so a failed commit
+            # leaves both pending and the next cycle rewrites them together
+            agent_state = {
+                'cycle_count': cycle_count,
+                'emotions': agent.emotions,
+                'status': 'observing' if observing else 'active',
+                'observation_mode': observing
+            }
+            if performance is not None:
+                agent_state['performance'] = performance
+            
+            # Save to Firestore in a single batched commit, in the background
+            snapshot = persist(
+                firestore.save_cycle_snapshot,
+                cycle_count,
+                state=agent_state,
+                result={
+                    'observations': result.get('observations', []),
+                    'theories': result.get('theories', []),
+                    'decisions': result.get('decisions', []),
+                    'next_action': result.get('next_action', ''),
+                    'observation_mode': observing
+                },
+                performance=performance,
+                observation_metrics=observation_metrics
+            )
+            if performance is not None:
+                snapshot.add_done_callback(mark_saved(performance))
             
             # Log results
             logger.info(f"✅ Cycle #{cycle_count} complete")
             logger.info(f"🎭 Emotional state: {agent.emotions}")
             
-            if agent._is_observation_mode():
+            if observing:
                 logger.info(f"📊 Patterns discovered: {len(agent.patterns_discovered)}")
                 # Check if transitioning soon
-                observation_end = agent.observation_start + timedelta(days=settings.observation_days)
-                remaining = observation_end - datetime.utcnow()
+                remaining = agent.observation_end - datetime.utcnow()
                 if remaining.total_seconds() < 3600:  # Less than 1 hour
                     logger.info("⚡ Observation period ending soon - preparing for trading!")
                     # Load high confidence patterns
-                    high_conf_patterns = firestore.get_high_confidence_patterns(settings.min_pattern_confidence)
+                    high_conf_patterns = await firestore.get_high_confidence_patterns(settings.min_pattern_confidence)
                     logger.info(f"🎯 Found {len(high_conf_patterns)} high-confidence patterns")
             else:
                 logger.info(f"💰 Total profit: ${agent.performance['total_profit']}")
@@ -28,14 +28,33 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def run_api_server():
-    """Run FastAPI server in a separate thread."""
-    uvicorn.run(
+def create_api_server() -> uvicorn.Server:
+    """Build the FastAPI server; run it with server.run() in a separate thread."""
+    config = uvicorn.Config(
         app,
         host=settings.api_host,
         port=settings.api_port,
         log_level=settings.log_level.lower()
     )
+    return uvicorn.Server(config)
+
+
+async def wait_for_api(server: uvicorn.Server, timeout: float = 10.0) -> bool:
+    """Wait until the API server is accepting connections.
+    
+    Polls server.started with exponential backoff, so startup costs only
+    as long as uvicorn actually takes, bounded by the timeout.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.05
+    while not server.started:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, 1.0)
+    return True
 
 
 async def main():
@@ -73,13 +92,15 @@ async def main():
     set_agent_references(agent, memory, gas_monitor, pool_scanner)
     
     # Start API server in background thread
-    api_thread = threading.Thread(target=run_api_server, daemon=True)
+    api_server = create_api_server()
+    api_thread = threading.Thread(target=api_server.run, daemon=True)
     api_thread.start()
     print(f"🌐 API server starting on http://{settings.api_host}:{settings.api_port}")
     print(f"📚 API docs available at http://{settings.api_host}:{settings.api_port}/docs")
     
     # Wait for API to start
-    await asyncio.sleep(2)
+    if not await wait_for_api(api_server):
+        logger.warning("API server did not report startup in time; continuing")
     
     print("👀 Starting 24/7 monitoring...")
     print("📊 Tracking gas prices, pool APRs, and market opportunities")
@@ -88,40 +109,46 @@ async def main():
     asyncio.create_task(gas_monitor.start_monitoring())
     asyncio.create_task(pool_scanner.start_scanning())
     
-    # Run agent reasoning loop
-    cycle_count = 0
-    while True:
-        cycle_count += 1
-        logger.info(f"🔄 Starting reasoning cycle #{cycle_count}")
-        
-        try:
-            # Run through agent graph
-            state = {
-                "observations": [],
-                "current_analysis": "",
-                "theories": [],
-                "rebalance_recommendations": [],
-                "compound_recommendations": [],
-                "emotions": agent.emotions,
-                "memories": [],
-                "decisions": [],
-                "next_action": "",
-                "messages": []
-            }
-            
-            # Execute workflow
-            result = await agent.graph.ainvoke(state)
-            
-            # Log results
-            logger.info(f"✅ Cycle #{cycle_count} complete")
-            logger.info(f"🎭 Emotional state: {agent.emotions}")
-            logger.info(f"💰 Total profit: ${agent.performance['total_profit']}")
-            
-        except Exception as e:
-            logger.error(f"Error in cycle #{cycle_count}: {e}")
+    # Run agent reasoning loop; release pooled connections on shutdown
+    try:
+        cycle_count = 0
+        while True:
+            cycle_count += 1
+            logger.info(f"🔄 Starting reasoning cycle #{cycle_count}")
             
-        # Wait before next reasoning cycle
-        await asyncio.sleep(settings.agent_cycle_time)
+            try:
+                # Run through agent graph
+                state = {
+                    "observations": [],
+                    "current_analysis": "",
+                    "theories": [],
+                    "rebalance_recommendations": [],
+                    "compound_recommendations": [],
+                    "emotions": agent.emotions,
+                    "memories": [],
+                    "decisions": [],
+                    "next_action": "",
+                    "messages": []
+                }
+                
+                # Execute workflow
+                result = await agent.graph.ainvoke(state)
+                
+                # Log results
+                logger.info(f"✅ Cycle #{cycle_count} complete")
+                logger.info(f"🎭 Emotional state: {agent.emotions}")
+                logger.info(f"💰 Total profit: ${agent.performance['total_profit']}")
+                
+            except Exception as e:
+                logger.error(f"Error in cycle #{cycle_count}: {e}")
+                
+            # Wait before next reasoning cycle
+            await asyncio.sleep(settings.agent_cycle_time)
+    finally:
+        await agent.pool_profiles.close()
+        if aerodrome_api:
+            await aerodrome_api.close()
+        await base_client.close()
 
 
 if __name__ == "__main__":
@@ -65,6 +65,14 @@ cat > firestore.indexes.json << 'EOF'
         { "fieldPath": "pool_address", "order": "ASCENDING" },
         { "fieldPath": "last_updated", "order": "DESCENDING" }
       ]
+    },
+    {
+      "collectionGroup": "pool_metrics",
+      "queryScope": "COLLECTION",
+      "fields": [
+        { "fieldPath": "pool_address", "order": "ASCENDING" },
+        { "fieldPath": "timestamp", "order": "DESCENDING" }
+      ]
     }
   ]
 }
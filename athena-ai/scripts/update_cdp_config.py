@@ -16,8 +16,12 @@ def update_cdp_secrets(project_id: str, cdp_json_path: str):
     
     # Load CDP credentials from JSON file
     print(f"Loading CDP credentials from: {cdp_json_path}")
-    with open(cdp_json_path, 'r') as f:
-        cdp_data = json.load(f)
+    try:
+        with open(cdp_json_path, 'r') as f:
+            cdp_data = json.load(f)
+    except FileNotFoundError:
+        print(f"❌ Error: File not found: {cdp_json_path}")
+        return False
     
     # Extract credentials
     api_key_id = cdp_data.get('id')
@@ -134,9 +138,6 @@ def main():
         sys.exit(1)
     
     cdp_json_path = sys.argv[1]
-    if not os.path.exists(cdp_json_path):
-        print(f"❌ Error: File not found: {cdp_json_path}")
-        sys.exit(1)
     
     # Get project ID from environment or settings
     project_id = os.environ.get('GCP_PROJECT_ID', 'athena-defi-agent-1752635199')
@@ -3,6 +3,7 @@ Athena AI Agent Core - LangGraph Implementation
 """
 import asyncio
 import logging
+import time
 from typing import Dict, List, TypedDict, Annotated, Sequence, Optional
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -15,7 +16,7 @@ from src.agent.pool_profiles import PoolProfileManager
 from src.agent.rebalancer import SmartRebalancer
 from src.cdp.base_client import BaseClient
 from src.integrations.quicknode_aerodrome import AerodromeAPI
-from config.settings import settings, STRATEGIES, EMOTIONAL_STATES
+from config.settings import settings, STRATEGIES, EMOTIONAL_STATES, DAY_NAMES
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +50,6 @@ class AthenaAgent:
         self.aerodrome_api = aerodrome_api
         
         # Initialize pool profile manager
-        from src.agent.pool_profiles import PoolProfileManager
         self.pool_profiles = PoolProfileManager(firestore_client)
         
         # Initialize smart rebalancer if API is available
@@ -93,6 +93,7 @@ class AthenaAgent:
         
         # Track observation mode
         self.observation_start = datetime.fromisoformat(settings.observation_start_time) if settings.observation_start_time else datetime.utcnow()
+        self.observation_end = self.observation_start + timedelta(days=settings.observation_days)
         self.patterns_discovered = []
         
     def _build_graph(self) -> StateGraph:
@@ -141,32 +142,47 @@ class AthenaAgent:
         
         observations = []
         
+        # One timestamp for the whole pass; perf_counter for its duration
+        started = time.perf_counter()
+        timestamp = datetime.utcnow().isoformat()
+        
         try:
-            # Get current balances
-            balances = await self.base_client.get_all_balances()
+            # Balances, gas and pool state are independent reads - fetch concurrently
+            balances, gas_price, pool_result = await asyncio.gather(
+                self.base_client.get_all_balances(),
+                self.base_client.get_gas_price(),
+                self.base_client.get_pool_info("WETH", "USDC", False),
+                return_exceptions=True
+            )
+            for result in (balances, gas_price):
+                if isinstance(result, Exception):
+                    raise result
+                    
+            # Current balances
             observations.append({
                 "type": "balance",
                 "data": balances,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": timestamp
             })
             
-            # Get gas price
-            gas_price = await self.base_client.get_gas_price()
+            # Gas price
             observations.append({
                 "type": "gas",
                 "data": {"price": str(gas_price), "unit": "gwei"},
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": timestamp
             })
             
             # Try to get real pool data
             try:
-                pool_info = await self.base_client.get_pool_info("WETH", "USDC", False)
+                if isinstance(pool_result, Exception):
+                    raise pool_result
+                pool_info = pool_result
                 if pool_info:
                     # Create flattened observation structure
                     observation = {
                         "type": "observation",
                         "category": "market_pattern",
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": timestamp,
                         "confidence": 1.0,
                         "pool": f"{pool_info['token_a']}/{pool_info['token_b']}",
                         "pool_address": pool_info["address"],
@@ -186,7 +202,7 @@ class AthenaAgent:
                 observations.append({
                     "type": "error",
                     "data": {"error": f"Pool data unavailable: {str(e)}", "pool": "WETH/USDC"},
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": timestamp
                 })
             
             # Store observations in memory
@@ -231,10 +247,11 @@ class AthenaAgent:
             observations.append({
                 "type": "error",
                 "data": {"error": str(e)},
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": timestamp
             })
             
         state["observations"] = observations
+        logger.debug("Observation pass took %.0fms", (time.perf_counter() - started) * 1000)
         return state
         
     async def remember_context(self, state: AgentState) -> Dict:
@@ -244,29 +261,35 @@ class AthenaAgent:
         memories = []
         
         try:
-            # Get recent successful strategies
-            strategy_memories = await self.memory.recall(
-                query="successful strategy high profit",
-                memory_type=MemoryType.OUTCOME,
-                limit=5
+            # Strategies, patterns and learnings are independent searches - run them concurrently
+            results = await asyncio.gather(
+                # Recent successful strategies
+                self.memory.recall(
+                    query="successful strategy high profit",
+                    memory_type=MemoryType.OUTCOME,
+                    limit=5
+                ),
+                # Market patterns
+                self.memory.recall(
+                    query="market pattern gas price pool APR",
+                    memory_type=MemoryType.PATTERN,
+                    limit=3
+                ),
+                # Recent learnings
+                self.memory.recall(
+                    query="learned effective strategy",
+                    memory_type=MemoryType.LEARNING,
+                    limit=3
+                ),
+                return_exceptions=True
             )
-            memories.extend(strategy_memories)
             
-            # Get market patterns
-            pattern_memories = await self.memory.recall(
-                query="market pattern gas price pool APR",
-                memory_type=MemoryType.PATTERN,
-                limit=3
-            )
-            memories.extend(pattern_memories)
-            
-            # Get recent learnings
-            learning_memories = await self.memory.recall(
-                query="learned effective strategy",
-                memory_type=MemoryType.LEARNING,
-                limit=3
-            )
-            memories.extend(learning_memories)
+            # Keep whatever succeeded, in the original order
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Memory retrieval error: {result}")
+                else:
+                    memories.extend(result)
             
         except Exception as e:
             logger.error(f"Memory retrieval error: {e}")
@@ -324,8 +347,9 @@ class AthenaAgent:
         logger.info("=� Forming theories...")
         
         # Extract pattern data for enhanced analysis
-        current_hour = datetime.utcnow().hour
-        current_day = datetime.utcnow().strftime("%A")
+        now = datetime.utcnow()
+        current_hour = now.hour
+        current_day = DAY_NAMES[now.weekday()]
         
         # Analyze gas patterns
         gas_observations = [obs for obs in state["observations"] if obs["type"] == "gas"]
@@ -364,33 +388,36 @@ class AthenaAgent:
         
         # Enhanced pattern storage during observation mode
         if self._is_observation_mode() and self.firestore:
+            gas_price = gas_observations[0]["data"]["price"] if gas_observations else None
+            high_apr_pools = pool_observations[0]["data"].get("high_apr_pools", []) if pool_observations and "data" in pool_observations[0] else []
+            context = {
+                "analysis": state['current_analysis'][:500],  # First 500 chars
+                "observations_count": len(state["observations"]),
+                "memory_count": len(state.get("memories", []))
+            }
+            
+            patterns = []
             for theory in theories:
                 if ":" in theory:
                     pattern_type, description = theory.split(":", 1)
-                    pattern_type = pattern_type.strip()
-                    description = description.strip()
                     
-                    # Categorize and store patterns
-                    pattern_data = {
-                        "type": pattern_type,
-                        "description": description,
+                    # Categorize patterns
+                    patterns.append({
+                        "type": pattern_type.strip(),
+                        "description": description.strip(),
                         "hour": current_hour,
                         "day": current_day,
-                        "gas_price": gas_observations[0]["data"]["price"] if gas_observations else None,
-                        "high_apr_pools": pool_observations[0]["data"].get("high_apr_pools", []) if pool_observations and "data" in pool_observations[0] else [],
+                        "gas_price": gas_price,
+                        "high_apr_pools": high_apr_pools,
                         "confidence": 0.5,  # Initial confidence
-                        "context": {
-                            "analysis": state['current_analysis'][:500],  # First 500 chars
-                            "observations_count": len(state["observations"]),
-                            "memory_count": len(state.get("memories", []))
-                        }
-                    }
-                    
-                    # Save pattern to Firestore
-                    pattern_id = self.firestore.save_pattern(pattern_data)
-                    if pattern_id:
-                        self.patterns_discovered.append(pattern_id)
-                        logger.info(f"📊 Discovered pattern: {pattern_type} - {description[:50]}...")
+                        "context": context
+                    })
+            
+            # Save all patterns to Firestore in one batched commit
+            pattern_ids = await self.firestore.save_patterns(patterns)
+            self.patterns_discovered.extend(pattern_ids)
+            for pattern, pattern_id in zip(patterns, pattern_ids):
+                logger.info("📊 Discovered pattern %s: %s - %.50s...", pattern_id, pattern['type'], pattern['description'])
         
         # Store promising theories in memory
         for theory in theories[:3]:  # Top 3 theories
@@ -539,14 +566,13 @@ class AthenaAgent:
         # If just transitioned from observation mode, use learned patterns
         if not self._is_observation_mode() and self.firestore:
             # Check if we recently transitioned (within last hour)
-            observation_end = self.observation_start + timedelta(days=settings.observation_days)
-            time_since_transition = datetime.utcnow() - observation_end
+            time_since_transition = datetime.utcnow() - self.observation_end
             
             if 0 <= time_since_transition.total_seconds() < 3600:  # Within first hour
                 logger.info("🎯 Using high-confidence patterns from observation period")
                 
                 # Get high confidence patterns
-                high_conf_patterns = self.firestore.get_high_confidence_patterns(settings.min_pattern_confidence)
+                high_conf_patterns = await self.firestore.get_high_confidence_patterns(settings.min_pattern_confidence)
                 
                 # Apply pattern-based decision making
                 for pattern in high_conf_patterns:
@@ -562,7 +588,7 @@ class AthenaAgent:
                                 "pattern_based": True,
                                 "pattern_id": pattern["id"]
                             })
-                            logger.info(f"📍 Pattern match: {pattern['type']} - {pattern['description'][:50]}...")
+                            logger.info("📍 Pattern match: %s - %.50s...", pattern['type'], pattern['description'])
         
         # Use pool profile predictions for better decisions
         if self.pool_profiles:
@@ -584,7 +610,7 @@ class AthenaAgent:
                         },
                         "profile_based": True
                     })
-                    logger.info(f"🔮 Pool prediction: {prediction['pool']} - APR {prediction['predicted_apr']}%")
+                    logger.info("🔮 Pool prediction: %s - APR %s%%", prediction['pool'], prediction['predicted_apr'])
         
         # Regular strategy evaluation
         for strategy_name, strategy_config in STRATEGIES.items():
@@ -626,6 +652,12 @@ class AthenaAgent:
         
         results = []
         
+        # Balances read during observe; reused until a strategy moves funds
+        observed_balances = next(
+            (obs["data"] for obs in state.get("observations", []) if obs.get("type") == "balance"),
+            None
+        )
+        
         for decision in state["decisions"]:
             try:
                 if decision["strategy"] == "rebalance":
@@ -635,12 +667,14 @@ class AthenaAgent:
                 elif decision["strategy"] == "arbitrage":
                     result = await self._execute_arbitrage(decision)
                 elif decision["strategy"] == "liquidity_provision":
-                    result = await self._execute_liquidity_provision(decision)
+                    result = await self._execute_liquidity_provision(decision, balances=observed_balances)
                 elif decision["strategy"] == "yield_farming":
                     result = await self._execute_yield_farming(decision)
                 else:
                     result = {"success": False, "error": "Unknown strategy"}
                     
+                if result.get("success"):
+                    observed_balances = None
                 results.append(result)
                 
             except Exception as e:
@@ -736,11 +770,10 @@ class AthenaAgent:
             return False
             
         # Calculate if observation period has ended
-        observation_end = self.observation_start + timedelta(days=settings.observation_days)
         current_time = datetime.utcnow()
         
-        if current_time < observation_end:
-            remaining = observation_end - current_time
+        if current_time < self.observation_end:
+            remaining = self.observation_end - current_time
             logger.info(f"📊 Observation mode: {remaining.days}d {remaining.seconds//3600}h remaining")
             return True
         else:
@@ -781,9 +814,11 @@ class AthenaAgent:
             token_out = decision.get("token_out", "WETH")
             amount = Decimal(str(decision.get("amount", "100")))
             
-            # Get gas price for cost calculation
-            gas_price = await self.base_client.get_gas_price()
-            estimated_gas = await self.base_client.estimate_gas("swap")
+            # Get gas price and estimate for cost calculation
+            gas_price, estimated_gas = await asyncio.gather(
+                self.base_client.get_gas_price(),
+                self.base_client.estimate_gas("swap")
+            )
             
             # Execute first swap
             tx_hash1 = await self.base_client.swap_tokens(
@@ -847,8 +882,13 @@ class AthenaAgent:
                 "error": str(e)
             }
         
-    async def _execute_liquidity_provision(self, decision: Dict) -> Dict:
-        """Execute liquidity provision strategy."""
+    async def _execute_liquidity_provision(self, decision: Dict, *, balances: Optional[Dict] = None) -> Dict:
+        """Execute liquidity provision strategy.
+        
+        Args:
+            decision: Strategy decision
+            balances: Wallet balances already fetched this cycle, if still current
+        """
         try:
             # Get LP details from decision
             pool = decision.get("pool", {})
@@ -865,9 +905,12 @@ class AthenaAgent:
                     "error": "Could not get pool info"
                 }
             
-            # Get balances
-            balance_a = await self.base_client.get_balance(token_a)
-            balance_b = await self.base_client.get_balance(token_b)
+            # Get balances, unless the cycle already has them
+            if balances is not None:
+                balance_a = Decimal(str(balances.get(token_a, 0)))
+                balance_b = Decimal(str(balances.get(token_b, 0)))
+            else:
+                balance_a, balance_b = await self.base_client.get_balances(token_a, token_b)
             
             # Calculate optimal amounts based on pool ratio
             ratio = pool_info.get("ratio", Decimal("1"))
@@ -1004,8 +1047,9 @@ class AthenaAgent:
     
     def _pattern_matches_current_state(self, pattern: Dict, state: AgentState) -> bool:
         """Check if a pattern matches current market state."""
-        current_hour = datetime.utcnow().hour
-        current_day = datetime.utcnow().strftime("%A")
+        now = datetime.utcnow()
+        current_hour = now.hour
+        current_day = DAY_NAMES[now.weekday()]
         
         # Check time-based patterns
         if pattern.get("hour") is not None:
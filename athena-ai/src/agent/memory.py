@@ -1,19 +1,62 @@
 """
 Athena's Memory System using Mem0
 """
+import asyncio
+import functools
 import json
 import logging
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from decimal import Decimal
 from typing import Dict, List, Optional, Any
 from enum import Enum
+from operator import itemgetter
 
+import orjson
 from mem0 import Memory, MemoryClient
 from pydantic import BaseModel, Field
 from config.settings import settings, MEMORY_CATEGORIES
 
 logger = logging.getLogger(__name__)
 
+# Hashed view of the category list for O(1) validation
+_MEMORY_CATEGORY_SET = frozenset(MEMORY_CATEGORIES)
+
+# Dedicated threads for blocking Mem0 calls, so bursts of remember/recall
+# don't compete with other to_thread users for the default executor
+_MEM0_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="mem0")
+
+
+async def _run_mem0(func, *args, **kwargs):
+    """Run a blocking Mem0 call on the dedicated executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_MEM0_EXECUTOR, functools.partial(func, *args, **kwargs))
+
+
+def _json_default(obj):
+    """Fallback for types orjson can't serialize natively.
+    
+    Also used by the stdlib fallback in _dumps, so datetimes and enums
+    come out the same (ISO 8601, enum value) whichever encoder ran.
+    """
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def _dumps(obj) -> str:
+    """Serialize to a JSON string; datetimes and enums are handled natively."""
+    try:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+    except orjson.JSONEncodeError:
+        # orjson rejects integers wider than 64 bits (e.g. raw wei amounts)
+        return json.dumps(obj, default=_json_default)
+
 
 class MemoryType(str, Enum):
     """Types of memories Athena can form."""
@@ -91,7 +134,7 @@ class AthenaMemory:
         """
         try:
             # Validate category
-            if category not in MEMORY_CATEGORIES:
+            if category not in _MEMORY_CATEGORY_SET:
                 logger.warning(f"Unknown category: {category}")
                 category = "general"
                 
@@ -108,73 +151,45 @@ class AthenaMemory:
             # Add to Mem0
             # Ensure content is JSON serializable
             if isinstance(content, dict):
-                import json
-                # Custom JSON encoder for Decimal and other types
-                def decimal_default(obj):
-                    if isinstance(obj, Decimal):
-                        return float(obj)
-                    elif isinstance(obj, datetime):
-                        return obj.isoformat()
-                    elif hasattr(obj, '__dict__'):
-                        return str(obj)
-                    return str(obj)
-                content_str = json.dumps(content, default=decimal_default)
+                content_str = _dumps(content)
             else:
                 content_str = str(content)
                 
+            # Resolve the enum value once; it's reused in the message and metadata
+            type_value = memory_type.value
             messages = [{
                 "role": "assistant",
-                "content": f"[{memory_type.value}] {content_str}"
+                "content": f"[{type_value}] {content_str}"
             }]
             
             if self.memory:
-                # Ensure all metadata values are JSON serializable
-                def convert_value(obj):
-                    """Recursively convert values for JSON serialization."""
-                    if isinstance(obj, datetime):
-                        return obj.isoformat()
-                    elif isinstance(obj, Decimal):
-                        return float(obj)
-                    elif isinstance(obj, dict):
-                        return {k: convert_value(v) for k, v in obj.items()}
-                    elif isinstance(obj, list):
-                        return [convert_value(item) for item in obj]
-                    elif hasattr(obj, '__dict__'):
-                        return str(obj)
-                    else:
-                        return obj
-                
-                safe_metadata = {}
-                for k, v in entry.metadata.items():
-                    safe_metadata[k] = convert_value(v)
+                # Ensure all metadata values are JSON serializable with one
+                # orjson round trip instead of a recursive Python walk
+                safe_metadata = orjson.loads(_dumps(entry.metadata))
                 
                 # Prepare full metadata
-                full_metadata = {
-                    **safe_metadata,
-                    "type": memory_type.value,
+                essential_metadata = {
+                    "type": type_value,
                     "category": category,
                     "confidence": confidence,
                     "timestamp": entry.timestamp.isoformat(),
                 }
+                full_metadata = {**safe_metadata, **essential_metadata}
                 
                 # Check metadata size and limit if necessary
-                import json
-                metadata_str = json.dumps(full_metadata)
+                metadata_str = _dumps(full_metadata)
                 if len(metadata_str) > 1900:  # Mem0 has 2000 char limit, leave buffer
                     # Keep only essential fields
-                    limited_metadata = {
-                        "type": memory_type.value,
-                        "category": category,
-                        "confidence": confidence,
-                        "timestamp": entry.timestamp.isoformat(),
-                    }
+                    limited_metadata = dict(essential_metadata)
                     # Add most important custom fields if they exist
                     for key in ["pool", "apr", "tvl", "volume", "pattern_type"]:
                         if key in safe_metadata:
                             limited_metadata[key] = safe_metadata[key]
                     full_metadata = limited_metadata
                 
-                result = self.memory.add(
+                # Mem0 is synchronous (embedding + vector store I/O); keep it off the event loop
+                result = await _run_mem0(
+                    self.memory.add,
                     messages=messages,
                     user_id=self.user_id,
                     metadata=full_metadata
@@ -196,9 +211,8 @@ class AthenaMemory:
                     logger.warning(f"Unexpected Mem0 response format: {type(result)}")
                     memory_id = ''
             else:
-                # Use local storage
-                import uuid
-                memory_id = str(uuid.uuid4())
+                # Use local storage; 128 random bits, hex-encoded in C
+                memory_id = secrets.token_hex(16)
                 self._local_memories.append({
                     "id": memory_id,
                     "entry": entry,
@@ -212,7 +226,7 @@ class AthenaMemory:
             if memory_type == MemoryType.PATTERN:
                 self.stats["patterns_discovered"] += 1
                 
-            logger.info(f"Stored memory {memory_id}: {content[:50]}...")
+            logger.info("Stored memory %s: %.50s...", memory_id, content)
             return memory_id
             
         except Exception as e:
@@ -250,7 +264,8 @@ class AthenaMemory:
                 
             # Search memories
             if self.memory:
-                results = self.memory.search(
+                results = await _run_mem0(
+                    self.memory.search,
                     query=query,
                     user_id=self.user_id,
                     limit=limit * 2,  # Get extra to filter by confidence
@@ -374,19 +389,9 @@ class AthenaMemory:
             success: Whether it was successful
         """
         try:
-            # Custom JSON encoder for Decimal and other types
-            def decimal_default(obj):
-                if isinstance(obj, Decimal):
-                    return float(obj)
-                elif isinstance(obj, datetime):
-                    return obj.isoformat()
-                elif hasattr(obj, '__dict__'):
-                    return str(obj)
-                return str(obj)
-            
             # Store outcome
             await self.remember(
-                content=f"Strategy '{strategy}' {'succeeded' if success else 'failed'}: {json.dumps(outcome, default=decimal_default)}",
+                content=f"Strategy '{strategy}' {'succeeded' if success else 'failed'}: {_dumps(outcome)}",
                 memory_type=MemoryType.OUTCOME,
                 category="strategy_performance",
                 metadata={
@@ -489,16 +494,18 @@ class AthenaMemory:
         
         # Filter by pool metadata
         pool_memories = []
+        now = datetime.utcnow()
         for mem in memories:
             metadata = mem.get("metadata", {})
             if metadata.get("pool") == pool_pair:
-                # Check time window if specified
-                if time_window_hours:
+                # Check time window if specified; memories without a usable timestamp are kept
+                timestamp_str = metadata.get("timestamp")
+                if time_window_hours and timestamp_str:
                     try:
-                        timestamp = datetime.fromisoformat(metadata.get("timestamp", ""))
-                        if (datetime.utcnow() - timestamp).total_seconds() / 3600 > time_window_hours:
+                        timestamp = datetime.fromisoformat(timestamp_str)
+                        if (now - timestamp).total_seconds() / 3600 > time_window_hours:
                             continue
-                    except:
+                    except (TypeError, ValueError):
                         pass
                         
                 pool_memories.append(mem)
@@ -609,10 +616,10 @@ class AthenaMemory:
                     mem["_timestamp"] = datetime.fromisoformat(timestamp_str)
                 else:
                     mem["_timestamp"] = datetime.min
-            except:
+            except (TypeError, ValueError):
                 mem["_timestamp"] = datetime.min
                 
-        memories.sort(key=lambda x: x["_timestamp"])
+        memories.sort(key=itemgetter("_timestamp"))
         
         # Remove temporary timestamp
         for mem in memories:
@@ -629,7 +636,7 @@ class AthenaMemory:
         """Export all memories for backup."""
         try:
             if self.memory:
-                all_memories = self.memory.get_all(user_id=self.user_id)
+                all_memories = await _run_mem0(self.memory.get_all, user_id=self.user_id)
             else:
                 all_memories = [{"id": m["id"], "content": m["messages"][0]["content"], 
                                 "metadata": {"type": m["entry"].type.value, 
@@ -7,17 +7,29 @@ better decision making and pattern recognition.
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from decimal import Decimal
+from operator import itemgetter
 from dataclasses import dataclass, field, asdict
 import json
 
+import numpy as np
+
+from config.settings import settings, DAY_NAMES
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _as_naive_utc(value) -> datetime:
+    """Read a stored timestamp: native Firestore timestamp or legacy ISO string."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value.replace(tzinfo=None)
+
+
+@dataclass(slots=True, frozen=True)
 class PoolMetrics:
-    """Point-in-time metrics for a pool."""
+    """Point-in-time metrics for a pool (immutable once recorded)."""
     timestamp: datetime
     apr: Decimal
     tvl: Decimal
@@ -43,7 +55,7 @@ class PoolMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PoolProfile:
     """Comprehensive profile for a single pool."""
     pool_address: str
@@ -110,7 +122,7 @@ class PoolProfile:
     def _update_time_patterns(self, metrics: PoolMetrics):
         """Update time-based patterns."""
         hour = metrics.timestamp.hour
-        day_name = metrics.timestamp.strftime("%A")
+        day_name = DAY_NAMES[metrics.timestamp.weekday()]
         
         # Update hourly pattern
         if hour not in self.hourly_patterns:
@@ -120,16 +132,7 @@ class PoolProfile:
                 "count": 0
             }
         
-        hour_data = self.hourly_patterns[hour]
-        hour_data["count"] += 1
-        hour_data["avg_apr"] = (
-            (hour_data["avg_apr"] * (hour_data["count"] - 1) + metrics.apr) / 
-            hour_data["count"]
-        )
-        hour_data["avg_volume"] = (
-            (hour_data["avg_volume"] * (hour_data["count"] - 1) + metrics.volume_24h) / 
-            hour_data["count"]
-        )
+        self._update_running_averages(self.hourly_patterns[hour], metrics)
         
         # Update daily pattern
         if day_name not in self.daily_patterns:
@@ -139,16 +142,19 @@ class PoolProfile:
                 "count": 0
             }
         
-        day_data = self.daily_patterns[day_name]
-        day_data["count"] += 1
-        day_data["avg_apr"] = (
-            (day_data["avg_apr"] * (day_data["count"] - 1) + metrics.apr) / 
-            day_data["count"]
-        )
-        day_data["avg_volume"] = (
-            (day_data["avg_volume"] * (day_data["count"] - 1) + metrics.volume_24h) / 
-            day_data["count"]
-        )
+        self._update_running_averages(self.daily_patterns[day_name], metrics)
+        
+    @staticmethod
+    def _update_running_averages(bucket: Dict, metrics: PoolMetrics):
+        """Fold one observation into a pattern bucket's running means.
+        
+        Uses the incremental (Welford) form avg += (x - avg) / n, which
+        avoids re-scaling the whole sum and keeps Decimal precision stable.
+        """
+        bucket["count"] += 1
+        n = bucket["count"]
+        bucket["avg_apr"] += (metrics.apr - bucket["avg_apr"]) / n
+        bucket["avg_volume"] += (metrics.volume_24h - bucket["avg_volume"]) / n
         
     def _update_behaviors(self):
         """Update behavioral metrics based on recent data."""
@@ -181,21 +187,14 @@ class PoolProfile:
         if len(metrics_with_gas) < 10:
             return
             
-        volumes = [float(m.volume_24h) for m in metrics_with_gas]
-        gas_prices = [float(m.gas_price) for m in metrics_with_gas]
-        
-        # Pearson correlation coefficient
-        n = len(volumes)
-        sum_x = sum(gas_prices)
-        sum_y = sum(volumes)
-        sum_xy = sum(x * y for x, y in zip(gas_prices, volumes))
-        sum_x2 = sum(x ** 2 for x in gas_prices)
-        sum_y2 = sum(y ** 2 for y in volumes)
-        
-        denominator = ((n * sum_x2 - sum_x ** 2) * (n * sum_y2 - sum_y ** 2)) ** 0.5
-        if denominator > 0:
-            correlation = (n * sum_xy - sum_x * sum_y) / denominator
-            self.correlation_with_gas = Decimal(str(correlation))
+        n = len(metrics_with_gas)
+        volumes = np.fromiter((m.volume_24h for m in metrics_with_gas), dtype=np.float64, count=n)
+        gas_prices = np.fromiter((m.gas_price for m in metrics_with_gas), dtype=np.float64, count=n)
+        
+        # Pearson correlation coefficient (undefined if either series is flat)
+        if volumes.std() > 0 and gas_prices.std() > 0:
+            correlation = np.corrcoef(gas_prices, volumes)[0, 1]
+            self.correlation_with_gas = Decimal(str(float(correlation)))
             
     def _update_confidence(self):
         """Update confidence score based on observations and consistency."""
@@ -226,7 +225,7 @@ class PoolProfile:
             return None
             
         hour = timestamp.hour
-        day_name = timestamp.strftime("%A")
+        day_name = DAY_NAMES[timestamp.weekday()]
         
         predictions = {}
         
@@ -261,19 +260,18 @@ class PoolProfile:
         anomalies = []
         
         # Calculate normal ranges (mean ± 2 * std dev)
-        aprs = [m.apr for m in self.recent_metrics[:-5]]  # Exclude most recent
-        volumes = [m.volume_24h for m in self.recent_metrics[:-5]]
-        
-        mean_apr = sum(aprs) / len(aprs)
-        std_apr = (sum((apr - mean_apr) ** 2 for apr in aprs) / len(aprs)).sqrt()
+        baseline = self.recent_metrics[:-5]  # Exclude most recent
+        n = len(baseline)
+        aprs = np.fromiter((m.apr for m in baseline), dtype=np.float64, count=n)
+        volumes = np.fromiter((m.volume_24h for m in baseline), dtype=np.float64, count=n)
         
-        mean_volume = sum(volumes) / len(volumes)
-        std_volume = (sum((v - mean_volume) ** 2 for v in volumes) / len(volumes)).sqrt()
+        mean_apr, std_apr = aprs.mean(), aprs.std()
+        mean_volume, std_volume = volumes.mean(), volumes.std()
         
         # Check recent metrics for anomalies
         for metric in self.recent_metrics[-5:]:
-            apr_deviation = abs(metric.apr - mean_apr) / std_apr if std_apr > 0 else 0
-            volume_deviation = abs(metric.volume_24h - mean_volume) / std_volume if std_volume > 0 else 0
+            apr_deviation = abs(float(metric.apr) - mean_apr) / std_apr if std_apr > 0 else 0
+            volume_deviation = abs(float(metric.volume_24h) - mean_volume) / std_volume if std_volume > 0 else 0
             
             if apr_deviation > 2:
                 anomalies.append({
@@ -295,35 +293,37 @@ class PoolProfile:
                 
         return anomalies
         
+    @staticmethod
+    def _patterns_to_dict(patterns: Dict) -> Dict[str, Dict]:
+        """Serialize hourly/daily pattern buckets, keyed by string."""
+        return {
+            str(key): {
+                "avg_apr": float(bucket["avg_apr"]),
+                "avg_volume": float(bucket["avg_volume"]),
+                "count": bucket["count"]
+            } for key, bucket in patterns.items()
+        }
+        
     def to_dict(self) -> Dict:
-        """Convert profile to dictionary for storage."""
+        """Convert profile to dictionary for storage.
+        
+        Datetimes are left as-is; Firestore stores them as native timestamps.
+        """
         return {
             "pool_address": self.pool_address,
             "pair": self.pair,
             "stable": self.stable,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self.created_at,
             "apr_range": [float(self.apr_range[0]), float(self.apr_range[1])],
             "tvl_range": [float(self.tvl_range[0]), float(self.tvl_range[1])],
             "volume_range": [float(self.volume_range[0]), float(self.volume_range[1])],
-            "hourly_patterns": {
-                str(k): {
-                    "avg_apr": float(v["avg_apr"]),
-                    "avg_volume": float(v["avg_volume"]),
-                    "count": v["count"]
-                } for k, v in self.hourly_patterns.items()
-            },
-            "daily_patterns": {
-                k: {
-                    "avg_apr": float(v["avg_apr"]),
-                    "avg_volume": float(v["avg_volume"]),
-                    "count": v["count"]
-                } for k, v in self.daily_patterns.items()
-            },
+            "hourly_patterns": self._patterns_to_dict(self.hourly_patterns),
+            "daily_patterns": self._patterns_to_dict(self.daily_patterns),
             "typical_volume_to_tvl": float(self.typical_volume_to_tvl),
             "volatility_score": float(self.volatility_score),
             "correlation_with_gas": float(self.correlation_with_gas),
             "observations_count": self.observations_count,
-            "last_updated": self.last_updated.isoformat() if self.last_updated else None,
+            "last_updated": self.last_updated,
             "confidence_score": float(self.confidence_score),
         }
 
@@ -334,6 +334,16 @@ class PoolProfileManager:
     def __init__(self, firestore_client=None):
         self.profiles: Dict[str, PoolProfile] = {}
         self.firestore = firestore_client
+        
+        # Profiles changed since the last Firestore flush
+        self._dirty: Set[str] = set()
+        self.flush_interval = settings.pool_profile_update_interval
+        self.max_pending = 50
+        
+        # Background flusher, started lazily on the first buffered write
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._flush_requested = asyncio.Event()
+        self._stop_requested = asyncio.Event()
         logger.info(f"PoolProfileManager initialized with firestore_client: {firestore_client is not None}")
         
     async def update_pool(self, pool_data: Dict, gas_price: Optional[Decimal] = None):
@@ -343,7 +353,7 @@ class PoolProfileManager:
             logger.warning(f"Pool data missing address. Available keys: {list(pool_data.keys())}")
             return
             
-        logger.debug(f"Updating pool profile for {pool_address} - pair: {pool_data.get('pair', 'unknown')}")
+        logger.debug("Updating pool profile for %s - pair: %s", pool_address, pool_data.get('pair', 'unknown'))
             
         # Create metrics from pool data
         metrics = PoolMetrics(
@@ -360,7 +370,7 @@ class PoolProfileManager:
         
         # Get or create profile
         if pool_address not in self.profiles:
-            logger.info(f"Creating new pool profile for {pool_address} - {pool_data.get('pair', '')}")
+            logger.info("Creating new pool profile for %s - %s", pool_address, pool_data.get('pair', ''))
             self.profiles[pool_address] = PoolProfile(
                 pool_address=pool_address,
                 pair=pool_data.get("pair", ""),
@@ -372,22 +382,59 @@ class PoolProfileManager:
         profile = self.profiles[pool_address]
         profile.update_with_metrics(metrics)
         
-        # Save to Firestore if available
+        # Buffer the write; the background flusher saves profiles in batches
         if self.firestore:
-            await self._save_profile(profile)
+            self._dirty.add(pool_address)
+            if self._flusher_task is None:
+                self._flusher_task = asyncio.create_task(self._flush_loop())
+            if len(self._dirty) >= self.max_pending:
+                self._flush_requested.set()
+                
+    async def _flush_loop(self):
+        """Flush dirty profiles every flush_interval, or early once max_pending is reached."""
+        while not self._stop_requested.is_set():
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            await self.flush()
             
-    async def _save_profile(self, profile: PoolProfile):
-        """Save profile to Firestore."""
+    async def close(self):
+        """Stop the background flusher and save any pending profiles."""
+        if self._flusher_task is not None:
+            # Wake the loop and let its in-flight flush finish rather than
+            # cancelling it mid-save
+            self._stop_requested.set()
+            self._flush_requested.set()
+            await self._flusher_task
+            self._flusher_task = None
+            self._stop_requested.clear()
+        await self.flush()
+        
+    async def flush(self):
+        """Save all profiles changed since the last flush to Firestore."""
+        if not self.firestore or not self._dirty:
+            return
+            
+        pending = {
+            address: self.profiles[address].to_dict()
+            for address in self._dirty if address in self.profiles
+        }
+        self._dirty.clear()
+        
+        saved = False
         try:
-            # Run sync Firestore operation in thread pool to avoid blocking
-            await asyncio.to_thread(
-                self.firestore.save_pool_profile,
-                profile.pool_address,
-                profile.to_dict()
-            )
-            logger.info(f"Pool profile saved for {profile.pool_address}")
+            # to_dict() emits only floats, ints, strings and datetimes
+            await self.firestore.save_pool_profiles(pending, prevalidated=True)
+            saved = True
+            logger.info(f"Flushed {len(pending)} pool profiles")
         except Exception as e:
-            logger.error(f"Failed to save pool profile for {profile.pool_address}: {e}")
+            logger.error(f"Failed to flush pool profiles: {e}")
+        finally:
+            # Keep them pending (also on cancellation) so the next flush retries
+            if not saved:
+                self._dirty.update(pending)
             
     async def load_profiles(self):
         """Load profiles from Firestore."""
@@ -395,14 +442,14 @@ class PoolProfileManager:
             return
             
         try:
-            profiles_data = self.firestore.get_all_pool_profiles()
+            profiles_data = await self.firestore.get_all_pool_profiles()
             for address, data in profiles_data.items():
                 # Reconstruct profile from data
                 profile = PoolProfile(
                     pool_address=address,
                     pair=data["pair"],
                     stable=data["stable"],
-                    created_at=datetime.fromisoformat(data["created_at"])
+                    created_at=_as_naive_utc(data["created_at"])
                 )
                 # Update with stored data
                 profile.apr_range = tuple(Decimal(str(x)) for x in data["apr_range"])
@@ -453,7 +500,7 @@ class PoolProfileManager:
                     "profile_confidence": float(profile.confidence_score)
                 })
                 
-        return sorted(opportunities, key=lambda x: x["predicted_apr"], reverse=True)
+        return sorted(opportunities, key=itemgetter("predicted_apr"), reverse=True)
         
     def get_summary(self) -> Dict:
         """Get summary of all profiles."""
@@ -5,6 +5,7 @@ Uses learned patterns from Mem0 to make intelligent rebalancing decisions.
 Optimizes for gas costs, compound timing, and APR maximization.
 """
 import logging
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
 from datetime import datetime, timedelta
@@ -13,7 +14,7 @@ import asyncio
 from src.agent.memory import AthenaMemory, MemoryType
 from src.integrations.quicknode_aerodrome import AerodromeAPI
 from src.cdp.base_client import BaseClient
-from config.settings import settings
+from config.settings import settings, DAY_NAMES
 
 logger = logging.getLogger(__name__)
 
@@ -138,7 +139,8 @@ class SmartRebalancer:
         """
         current_apr = position["apr"]
         current_tvl = position["tvl"]
-        pool_age_days = (datetime.utcnow() - position.get("created_at", datetime.utcnow())).days
+        now = datetime.utcnow()
+        pool_age_days = (now - position.get("created_at", now)).days
         
         # Extract patterns from memories
         apr_changes = []
@@ -255,7 +257,7 @@ class SmartRebalancer:
             scored_opportunities.append({**opp, "score": score})
             
         # Return best opportunity
-        best = max(scored_opportunities, key=lambda x: x["score"])
+        best = max(scored_opportunities, key=itemgetter("score"))
         
         if best["score"] > 0.7:  # Confidence threshold
             return best
@@ -343,8 +345,9 @@ class SmartRebalancer:
             limit=20
         )
         
-        current_hour = datetime.utcnow().hour
-        current_day = datetime.utcnow().strftime("%A")
+        now = datetime.utcnow()
+        current_hour = now.hour
+        current_day = DAY_NAMES[now.weekday()]
         
         # Find patterns matching current time
         relevant_prices = []
@@ -503,9 +506,10 @@ class SmartRebalancer:
             if not remove_tx:
                 raise Exception("Failed to remove liquidity")
                 
-            # Step 2: Get balances of received tokens
-            token0_balance = await self.base_client.get_balance(from_position["token0"])
-            token1_balance = await self.base_client.get_balance(from_position["token1"])
+            # Step 2: Get balances of received tokens (fresh, the removal just moved them)
+            token0_balance, token1_balance = await self.base_client.get_balances(
+                from_position["token0"], from_position["token1"], force=True
+            )
             
             # Step 3: Swap tokens if needed to match new pool requirements
             # This is simplified - in production would calculate optimal ratios
@@ -6,11 +6,13 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Optional
 
+import orjson
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
-from config.settings import settings
+from config.settings import settings, STRATEGIES
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +20,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Athena AI API",
     description="24/7 DeFi Agent API for monitoring and control",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # orjson renders responses in C
 )
 
 # Add CORS middleware
@@ -166,8 +169,6 @@ async def get_positions():
 @app.get("/strategies/active", response_model=StrategyResponse)
 async def get_active_strategies():
     """Get active strategies."""
-    from config.settings import STRATEGIES
-    
     active = [name for name, config in STRATEGIES.items() if config["enabled"]]
     
     return StrategyResponse(
@@ -230,7 +231,8 @@ async def websocket_endpoint(websocket: WebSocket):
         while True:
             # Send periodic updates
             if agent:
-                await websocket.send_json({
+                # Encode with orjson like the HTTP responses; gas stats are Decimals
+                update = orjson.dumps({
                     "type": "status",
                     "timestamp": datetime.utcnow().isoformat(),
                     "emotions": agent.emotions,
@@ -238,7 +240,8 @@ async def websocket_endpoint(websocket: WebSocket):
                         "total_profit": float(agent.performance["total_profit"]),
                     },
                     "gas": gas_monitor.stats["current_price"] if gas_monitor else 0,
-                })
+                }, default=float)
+                await websocket.send_text(update.decode())
                 
             # Wait before next update
             await asyncio.sleep(5)
@@ -3,34 +3,113 @@ CDP SDK Wrapper for Base Chain Operations
 """
 import asyncio
 import logging
+import os
+import secrets
 import time
+import weakref
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
 
+import orjson
+
 # Ensure we're using the correct CDP SDK version
 from .version_check import check_cdp_version
 
 from cdp import CdpClient
 from config.settings import settings
-from config.contracts import CONTRACTS, TOKENS, DEFAULT_SLIPPAGE
+from config.contracts import CONTRACTS, TOKENS, DEFAULT_SLIPPAGE, GAS_BUFFER
 
 logger = logging.getLogger(__name__)
 
+# Gas estimates by method type, with the GAS_BUFFER already applied
+_GAS_ESTIMATES = {
+    method: int(estimate * GAS_BUFFER)
+    for method, estimate in {
+        "swap": 250000,
+        "addLiquidity": 350000,
+        "removeLiquidity": 300000,
+        "approve": 50000,
+        "transfer": 65000,
+    }.items()
+}
+_DEFAULT_GAS_ESTIMATE = int(200000 * GAS_BUFFER)
+
+# Token decimals for common Base tokens, keyed by lowercase address (read-only)
+_TOKEN_DECIMALS = MappingProxyType({
+    "0x4200000000000000000000000000000000000006": 18,  # WETH
+    "0x833589fcd6edb6e08f4c7c32d4f71b54bda02913": 6,   # USDC
+    "0xd9aaec86b65d86f6a7b5b1b0c42ffa531710b6ca": 6,   # USDbC
+    "0x50c5725949a6f0c72e6c4a641f24049a917db0cb": 18,  # DAI
+    "0x940181a94a35a4569e4529a3cdfb74e38fd98631": 18,  # AERO
+})
+
+# Fallback pool addresses, keyed by (token_a, token_b, stable) with lowercase addresses
+_KNOWN_POOLS = {
+    # WETH-USDC volatile (Standard AMM) - verified working
+    (TOKENS["WETH"].lower(), TOKENS["USDC"].lower(), False): "0xcDAc0d6c6C59727a65F871236188350531885C43",
+    (TOKENS["USDC"].lower(), TOKENS["WETH"].lower(), False): "0xcDAc0d6c6C59727a65F871236188350531885C43",
+    
+    # Note: SlipStream pool 0xb2cc224c1c9fee385f8ad6a55b4d94e92359dc59 uses different interface
+    
+    # AERO-USDC volatile (verified working)
+    ("0x940181a94a35a4569e4529a3cdfb74e38fd98631", TOKENS["USDC"].lower(), False): "0x6cDcb1C4A4D1C3C6d054b27AC5B77e89eAFb971d",
+    (TOKENS["USDC"].lower(), "0x940181a94a35a4569e4529a3cdfb74e38fd98631", False): "0x6cDcb1C4A4D1C3C6d054b27AC5B77e89eAFb971d",
+    
+    # Add more verified pools as needed
+}
+
 
 class BaseClient:
     """CDP client for interacting with Base blockchain and Aerodrome."""
     
+    # Fixed attribute set; no per-instance __dict__
+    __slots__ = (
+        "cdp",
+        "wallet",
+        "_rpc_reader",
+        "_rpc_lock",
+        "_rpc_semaphore",
+        "_initialized",
+        "_init_lock",
+        "_wallet_secret",
+        "_rpc_url",
+        "price_cache",
+        "CACHE_DURATION",
+        "_price_inflight",
+        "_balances_cache",
+        "_balances_locks",
+        "_balance_ttl",
+        "stablecoins",
+    )
+    
     def __init__(self):
         """Initialize CDP client."""
         self.cdp = None
         self.wallet = None
+        self._rpc_reader = None
+        self._rpc_lock = asyncio.Lock()
+        self._rpc_semaphore = asyncio.Semaphore(settings.rpc_max_concurrency)
         self._initialized = False
+        self._init_lock = asyncio.Lock()
         self._wallet_secret = None
         
+        # cdp_rpc_url is a computed property; resolve it once
+        self._rpc_url = settings.cdp_rpc_url
+        
         # Price cache for token USD prices
         self.price_cache = {}  # token_addr -> {"price": Decimal, "timestamp": float, "source": str}
         self.CACHE_DURATION = 300  # 5 minutes
         
+        # In-flight price lookups, so concurrent callers share one fetch
+        self._price_inflight: Dict[str, asyncio.Future] = {}
+        
+        # (fetched_at, balances) from wallet.balances(); dropped after any transaction
+        self._balances_cache: Optional[Tuple[float, Dict]] = None
+        # One lock per event loop: the API server calls in from its own thread and loop
+        self._balances_locks = weakref.WeakKeyDictionary()  # event loop -> asyncio.Lock
+        self._balance_ttl = settings.balance_cache_ttl
+        
         # Stablecoins that are always $1
         self.stablecoins = {
             "0x833589fcd6edb6e08f4c7c32d4f71b54bda02913",  # USDC
@@ -39,20 +118,25 @@ class BaseClient:
         }
         
     async def initialize(self):
-        """Initialize CDP SDK and wallet."""
+        """Initialize CDP SDK and wallet.
+        
+        Concurrent callers share a single initialization, so startup
+        never creates more than one CDP client or account.
+        """
         if self._initialized:
             return
             
+        async with self._init_lock:
+            if not self._initialized:
+                await self._initialize()
+                
+    async def _initialize(self):
+        """Create the CDP client and load or create the account."""
         try:
             # Configure CDP from JSON file if available
-            import os
-            import json
-            import secrets
-            
             json_path = os.environ.get('CDP_API_KEY_JSON_PATH')
-            if json_path and os.path.exists(json_path):
-                with open(json_path, 'r') as f:
-                    cdp_data = json.load(f)
+            cdp_data = self._load_key_file(json_path) if json_path else None
+            if cdp_data is not None:
                 api_key_id = cdp_data.get('id', cdp_data.get('api_key_name'))
                 api_key_secret = cdp_data.get('privateKey', cdp_data.get('private_key'))
                 logger.info(f"Loaded CDP credentials from JSON file: {json_path}")
@@ -70,7 +154,8 @@ class BaseClient:
                 # Also save to secret manager for persistence
                 try:
                     from src.gcp.secret_manager import create_or_update_secret
-                    create_or_update_secret("cdp-wallet-secret", self._wallet_secret)
+                    # Blocking gRPC round trips; keep them off the event loop
+                    await asyncio.to_thread(create_or_update_secret, "cdp-wallet-secret", self._wallet_secret)
                     logger.info("✅ Saved wallet secret to Secret Manager")
                 except Exception as e:
                     logger.warning(f"Could not save wallet secret to Secret Manager: {e}")
@@ -104,9 +189,54 @@ class BaseClient:
             logger.error(f"Failed to initialize CDP client: {e}")
             raise
         finally:
-            # Close client if initialization fails
-            if hasattr(self, 'cdp') and not self._initialized:
+            # Close client if initialization fails (it may not have been created yet)
+            if self.cdp is not None and not self._initialized:
                 await self.cdp.close()
+                self.cdp = None
+            
+    @staticmethod
+    def _load_key_file(json_path: str) -> Optional[Dict]:
+        """Read a CDP API key JSON file, or None if it doesn't exist.
+        
+        Opening directly (instead of checking exists() first) is one
+        syscall fewer and can't race with the file being removed.
+        """
+        try:
+            with open(json_path, 'rb') as f:
+                return orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
+            
+    async def _get_rpc_reader(self):
+        """Get the shared RPC reader, opening it on first use.
+        
+        The reader is kept open for the client's lifetime so every call
+        reuses its pooled HTTP connections instead of re-handshaking.
+        """
+        if self._rpc_reader is None:
+            async with self._rpc_lock:
+                if self._rpc_reader is None:
+                    from src.blockchain.rpc_reader import RPCReader
+                    reader = RPCReader(self._rpc_url)
+                    await reader.__aenter__()
+                    self._rpc_reader = reader
+        return self._rpc_reader
+        
+    async def _rpc_call(self, method: str, *args):
+        """Call an RPCReader method, bounded by the RPC concurrency limit."""
+        reader = await self._get_rpc_reader()
+        async with self._rpc_semaphore:
+            return await getattr(reader, method)(*args)
+            
+    async def close(self):
+        """Release the RPC reader and CDP client."""
+        if self._rpc_reader is not None:
+            reader, self._rpc_reader = self._rpc_reader, None
+            await reader.__aexit__(None, None, None)
+        if self.cdp is not None:
+            await self.cdp.close()
+            self.cdp = None
+            self._initialized = False
             
     @property
     def address(self) -> str:
@@ -121,12 +251,49 @@ class BaseClient:
         else:
             raise ValueError("Unable to get wallet address")
         
-    async def get_balance(self, token: str = "ETH") -> Decimal:
-        """Get token balance."""
-        try:
+    async def _get_wallet_balances(self, force: bool = False) -> Dict:
+        """Get the wallet's balances, reusing a recent snapshot.
+        
+        Args:
+            force: Skip the cache and always query the wallet
+            
+        Returns:
+            Balances keyed by token symbol
+        """
+        requested_at = time.monotonic()
+        cached = self._balances_cache
+        if not force and cached and requested_at - cached[0] < self._balance_ttl:
+            return cached[1]
+            
+        # Coalesces concurrent refreshes on this loop into one query
+        loop = asyncio.get_running_loop()
+        lock = self._balances_locks.get(loop)
+        if lock is None:
+            lock = self._balances_locks[loop] = asyncio.Lock()
+            
+        async with lock:
+            # A query that started after this request is fresh enough, even when forced
+            cached = self._balances_cache
+            if cached and (cached[0] >= requested_at or
+                           (not force and time.monotonic() - cached[0] < self._balance_ttl)):
+                return cached[1]
+                
             # For CDP SDK v1.23.0, use the wallet's balances method
+            fetched_at = time.monotonic()
+            balances = await self.wallet.balances()
+            self._balances_cache = (fetched_at, balances)
+            return balances
+        
+    async def get_balance(self, token: str = "ETH", force: bool = False) -> Decimal:
+        """Get token balance.
+        
+        Args:
+            token: Token symbol
+            force: Bypass the short-lived balances cache
+        """
+        try:
             if hasattr(self.wallet, 'balances'):
-                balances = await self.wallet.balances()
+                balances = await self._get_wallet_balances(force)
                 # balances is a dict like {"ETH": balance_value}
                 if token in balances:
                     return Decimal(str(balances[token]))
@@ -137,16 +304,32 @@ class BaseClient:
             logger.error(f"Failed to get balance for {token}: {e}")
             return Decimal("0")
             
+    async def get_balances(self, *tokens: str, force: bool = False) -> List[Decimal]:
+        """Get several token balances from a single wallet query.
+        
+        Args:
+            tokens: Token symbols
+            force: Bypass the short-lived balances cache
+            
+        Returns:
+            Balances in the order the tokens were given
+        """
+        try:
+            wallet_balances = {}
+            if hasattr(self.wallet, 'balances'):
+                wallet_balances = await self._get_wallet_balances(force)
+            return [Decimal(str(wallet_balances.get(token, 0))) for token in tokens]
+        except Exception as e:
+            logger.error(f"Failed to get balances for {tokens}: {e}")
+            return [Decimal("0")] * len(tokens)
+            
     async def get_all_balances(self) -> Dict[str, Decimal]:
         """Get all token balances."""
-        balances = {}
-        
-        # Get ETH balance
-        balances["ETH"] = await self.get_balance("ETH")
+        token_names = list(TOKENS)
+        eth_balance, *token_balances = await self.get_balances("ETH", *token_names)
         
-        # Get token balances
-        for token_name, token_address in TOKENS.items():
-            balance = await self.get_balance(token_name)
+        balances = {"ETH": eth_balance}
+        for token_name, balance in zip(token_names, token_balances):
             if balance > 0:
                 balances[token_name] = balance
                 
@@ -197,9 +380,11 @@ class BaseClient:
             min_amount_out = quote * Decimal(str(1 - slippage))
             
             # Build transaction
-            deadline = int(asyncio.get_event_loop().time()) + 1200  # 20 minutes
+            deadline = int(time.time()) + 1200  # 20 minutes
             
-            contract_invocation = self.wallet.invoke_contract(
+            # invoke_contract and wait() are blocking SDK calls; run them in a worker thread
+            contract_invocation = await asyncio.to_thread(
+                self.wallet.invoke_contract,
                 contract_address=CONTRACTS["router"]["address"],
                 method="swapExactTokensForTokens",
                 args={
@@ -212,7 +397,7 @@ class BaseClient:
             )
             
             # Wait for transaction
-            contract_invocation.wait()
+            await asyncio.to_thread(contract_invocation.wait)
             
             logger.info(
                 f"Swap successful: {amount_in} {token_in} -> {token_out} "
@@ -224,6 +409,9 @@ class BaseClient:
         except Exception as e:
             logger.error(f"Swap failed: {e}")
             return None
+        finally:
+            # Balances may have moved even if waiting failed
+            self._balances_cache = None
             
     async def get_token_price_usd(self, token_addr: str) -> Decimal:
         """Get USD price for token with caching.
@@ -241,7 +429,7 @@ class BaseClient:
         if token_addr in self.price_cache:
             cache_entry = self.price_cache[token_addr]
             if time.time() - cache_entry["timestamp"] < self.CACHE_DURATION:
-                logger.debug(f"Using cached price for {token_addr}: ${cache_entry['price']:.4f}")
+                logger.debug("Using cached price for %s: $%.4f", token_addr, cache_entry['price'])
                 return cache_entry["price"]
         
         # Stablecoins are always $1
@@ -254,6 +442,17 @@ class BaseClient:
             }
             return price
         
+        # Join an identical lookup that is already running
+        inflight = self._price_inflight.get(token_addr)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fetch_token_price_usd(token_addr))
+            self._price_inflight[token_addr] = inflight
+            inflight.add_done_callback(lambda _: self._price_inflight.pop(token_addr, None))
+            
+        return await asyncio.shield(inflight)
+        
+    async def _fetch_token_price_usd(self, token_addr: str) -> Decimal:
+        """Read a token's USD price from DEX pools and cache it."""
         # Get price from DEX pools
         price = Decimal("0")
         source = "unknown"
@@ -262,56 +461,56 @@ class BaseClient:
             # WETH price from WETH/USDC pool
             if token_addr == TOKENS["WETH"].lower():
                 # Get pool info without TVL calculation to avoid recursion
-                from src.blockchain.rpc_reader import RPCReader
-                async with RPCReader(settings.cdp_rpc_url) as reader:
-                    pool_address = await self._get_pool_address("WETH", "USDC", False)
-                    if pool_address:
-                        # First get token info to determine token ordering
-                        token_info = await reader.get_token_info(pool_address)
-                        reserves_data = await reader.get_pool_reserves(pool_address)
+                pool_address = await self._get_pool_address("WETH", "USDC", False)
+                if pool_address:
+                    # Token ordering and reserves are independent reads
+                    token_info, reserves_data = await asyncio.gather(
+                        self._rpc_call("get_token_info", pool_address),
+                        self._rpc_call("get_pool_reserves", pool_address)
+                    )
+                    
+                    if token_info and reserves_data:
+                        # Determine which reserve is WETH and which is USDC
+                        if token_info["token0"].lower() == TOKENS["WETH"].lower():
+                            # WETH is token0, USDC is token1
+                            weth_reserve = reserves_data["reserve0"] / Decimal(10**18)  # WETH has 18 decimals
+                            usdc_reserve = reserves_data["reserve1"] / Decimal(10**6)   # USDC has 6 decimals
+                        else:
+                            # USDC is token0, WETH is token1
+                            usdc_reserve = reserves_data["reserve0"] / Decimal(10**6)
+                            weth_reserve = reserves_data["reserve1"] / Decimal(10**18)
                         
-                        if token_info and reserves_data:
-                            # Determine which reserve is WETH and which is USDC
-                            if token_info["token0"].lower() == TOKENS["WETH"].lower():
-                                # WETH is token0, USDC is token1
-                                weth_reserve = reserves_data["reserve0"] / Decimal(10**18)  # WETH has 18 decimals
-                                usdc_reserve = reserves_data["reserve1"] / Decimal(10**6)   # USDC has 6 decimals
-                            else:
-                                # USDC is token0, WETH is token1
-                                usdc_reserve = reserves_data["reserve0"] / Decimal(10**6)
-                                weth_reserve = reserves_data["reserve1"] / Decimal(10**18)
-                            
-                            if weth_reserve > 0:
-                                price = usdc_reserve / weth_reserve  # USDC per WETH
-                                source = "WETH/USDC"
-                                logger.info(f"WETH price from DEX: ${price:.2f}")
+                        if weth_reserve > 0:
+                            price = usdc_reserve / weth_reserve  # USDC per WETH
+                            source = "WETH/USDC"
+                            logger.info("WETH price from DEX: $%.2f", price)
             
             # AERO price from AERO/USDC pool
             elif token_addr == TOKENS["AERO"].lower():
                 # Get pool info without TVL calculation to avoid recursion
-                from src.blockchain.rpc_reader import RPCReader
-                async with RPCReader(settings.cdp_rpc_url) as reader:
-                    pool_address = await self._get_pool_address("AERO", "USDC", False)
-                    if pool_address:
-                        # First get token info to determine token ordering
-                        token_info = await reader.get_token_info(pool_address)
-                        reserves_data = await reader.get_pool_reserves(pool_address)
+                pool_address = await self._get_pool_address("AERO", "USDC", False)
+                if pool_address:
+                    # Token ordering and reserves are independent reads
+                    token_info, reserves_data = await asyncio.gather(
+                        self._rpc_call("get_token_info", pool_address),
+                        self._rpc_call("get_pool_reserves", pool_address)
+                    )
+                    
+                    if token_info and reserves_data:
+                        # Determine which reserve is AERO and which is USDC
+                        if token_info["token0"].lower() == TOKENS["AERO"].lower():
+                            # AERO is token0, USDC is token1
+                            aero_reserve = reserves_data["reserve0"] / Decimal(10**18)  # AERO has 18 decimals
+                            usdc_reserve = reserves_data["reserve1"] / Decimal(10**6)   # USDC has 6 decimals
+                        else:
+                            # USDC is token0, AERO is token1
+                            usdc_reserve = reserves_data["reserve0"] / Decimal(10**6)
+                            aero_reserve = reserves_data["reserve1"] / Decimal(10**18)
                         
-                        if token_info and reserves_data:
-                            # Determine which reserve is AERO and which is USDC
-                            if token_info["token0"].lower() == TOKENS["AERO"].lower():
-                                # AERO is token0, USDC is token1
-                                aero_reserve = reserves_data["reserve0"] / Decimal(10**18)  # AERO has 18 decimals
-                                usdc_reserve = reserves_data["reserve1"] / Decimal(10**6)   # USDC has 6 decimals
-                            else:
-                                # USDC is token0, AERO is token1
-                                usdc_reserve = reserves_data["reserve0"] / Decimal(10**6)
-                                aero_reserve = reserves_data["reserve1"] / Decimal(10**18)
-                            
-                            if aero_reserve > 0:
-                                price = usdc_reserve / aero_reserve  # USDC per AERO
-                                source = "AERO/USDC"
-                                logger.info(f"AERO price from DEX: ${price:.4f}")
+                        if aero_reserve > 0:
+                            price = usdc_reserve / aero_reserve  # USDC per AERO
+                            source = "AERO/USDC"
+                            logger.info("AERO price from DEX: $%.4f", price)
             
             # Cache the result
             if price > 0:
@@ -347,9 +546,11 @@ class BaseClient:
             min_amount_a = amount_a * Decimal(str(1 - slippage))
             min_amount_b = amount_b * Decimal(str(1 - slippage))
             
-            deadline = int(asyncio.get_event_loop().time()) + 1200
+            deadline = int(time.time()) + 1200
             
-            contract_invocation = self.wallet.invoke_contract(
+            # Same blocking submit-and-wait as swap_tokens, off the event loop
+            contract_invocation = await asyncio.to_thread(
+                self.wallet.invoke_contract,
                 contract_address=CONTRACTS["router"]["address"],
                 method="addLiquidity",
                 args={
@@ -365,7 +566,7 @@ class BaseClient:
                 }
             )
             
-            contract_invocation.wait()
+            await asyncio.to_thread(contract_invocation.wait)
             
             logger.info(
                 f"Added liquidity: {amount_a} {token_a} + {amount_b} {token_b} "
@@ -377,6 +578,8 @@ class BaseClient:
         except Exception as e:
             logger.error(f"Add liquidity failed: {e}")
             return None
+        finally:
+            self._balances_cache = None
             
     async def get_pool_info(
         self,
@@ -399,67 +602,58 @@ class BaseClient:
             if not pool_address:
                 return {}
                 
-            # Use RPC reader to get real data
-            from src.blockchain.rpc_reader import RPCReader
-            
-            # Use CDP's authenticated RPC endpoint
-            async with RPCReader(settings.cdp_rpc_url) as reader:
-                # Get token info first to determine decimals
-                token_info = await reader.get_token_info(pool_address)
-                if not token_info:
-                    logger.error(f"Failed to read token info for pool {pool_address}")
-                    return {}
+            # Read on-chain state through CDP's authenticated RPC endpoint
+            # Token info, reserves and supply are independent reads, so issue them together
+            token_info, reserves_data, total_supply_decimal = await asyncio.gather(
+                self._rpc_call("get_token_info", pool_address),
+                self._rpc_call("get_pool_reserves", pool_address),
+                self._rpc_call("get_total_supply", pool_address)
+            )
+            if not token_info:
+                logger.error(f"Failed to read token info for pool {pool_address}")
+                return {}
+            
+            if not reserves_data:
+                logger.error(f"Failed to read reserves for pool {pool_address}")
+                return {}
                 
-                # Get reserves
-                reserves_data = await reader.get_pool_reserves(pool_address)
-                if not reserves_data:
-                    logger.error(f"Failed to read reserves for pool {pool_address}")
-                    return {}
-                    
-                reserve0 = reserves_data["reserve0"]
-                reserve1 = reserves_data["reserve1"]
+            reserve0 = reserves_data["reserve0"]
+            reserve1 = reserves_data["reserve1"]
+            
+            # Apply total supply
+            if not total_supply_decimal:
+                total_supply_decimal = Decimal("0")
+            else:
+                # Apply decimals - RPC reader now returns raw values
+                # LP tokens always have 18 decimals
+                total_supply_decimal = total_supply_decimal / Decimal(10**18)
                 
-                # Get total supply
-                total_supply_decimal = await reader.get_total_supply(pool_address)
-                if not total_supply_decimal:
-                    total_supply_decimal = Decimal("0")
-                else:
-                    # Apply decimals - RPC reader now returns raw values
-                    # LP tokens always have 18 decimals
-                    total_supply_decimal = total_supply_decimal / Decimal(10**18)
-                    
-            # Determine decimals based on token addresses
-            # Common Base tokens (lowercase for comparison)
-            decimals_map = {
-                "0x4200000000000000000000000000000000000006": 18,  # WETH
-                "0x833589fcd6edb6e08f4c7c32d4f71b54bda02913": 6,   # USDC
-                "0xd9aaec86b65d86f6a7b5b1b0c42ffa531710b6ca": 6,   # USDbC
-                "0x50c5725949a6f0c72e6c4a641f24049a917db0cb": 18,  # DAI
-                "0x940181a94a35a4569e4529a3cdfb74e38fd98631": 18,  # AERO
-            }
+            token0_addr = token_info["token0"].lower()
+            token1_addr = token_info["token1"].lower()
             
             # Get decimals for token0 and token1
-            decimals0 = decimals_map.get(token_info["token0"].lower(), 18)
-            decimals1 = decimals_map.get(token_info["token1"].lower(), 18)
+            decimals0 = _TOKEN_DECIMALS.get(token0_addr, 18)
+            decimals1 = _TOKEN_DECIMALS.get(token1_addr, 18)
             
             # Apply decimals - RPC reader now returns raw values
             reserve0 = reserve0 / Decimal(10**decimals0)
             reserve1 = reserve1 / Decimal(10**decimals1)
             
             # Calculate TVL using cached token prices
-            token0_addr = token_info["token0"].lower()
-            token1_addr = token_info["token1"].lower()
             
-            # Get USD prices for both tokens
-            price0 = await self.get_token_price_usd(token0_addr)
-            price1 = await self.get_token_price_usd(token1_addr)
+            # Get USD prices for both tokens concurrently
+            price0, price1 = await asyncio.gather(
+                self.get_token_price_usd(token0_addr),
+                self.get_token_price_usd(token1_addr)
+            )
             
             # Calculate TVL
             if price0 > 0 and price1 > 0:
                 tvl = (reserve0 * price0) + (reserve1 * price1)
-                logger.debug(f"TVL calculation for {token_a}/{token_b}: "
-                           f"reserve0={reserve0:.4f} * price0=${price0:.4f} + "
-                           f"reserve1={reserve1:.4f} * price1=${price1:.4f} = ${tvl:,.2f}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"TVL calculation for {token_a}/{token_b}: "
+                               f"reserve0={reserve0:.4f} * price0=${price0:.4f} + "
+                               f"reserve1={reserve1:.4f} * price1=${price1:.4f} = ${tvl:,.2f}")
             else:
                 # If we can't get prices, log warning and use 0
                 tvl = Decimal("0")
@@ -548,48 +742,31 @@ class BaseClient:
             token_b_address = TOKENS.get(token_b, token_b)
             
             # Try to get from factory first using CDP RPC
-            from src.blockchain.rpc_reader import RPCReader
-            
             try:
-                async with RPCReader(settings.cdp_rpc_url) as reader:
-                    pool_address = await reader.get_pool_address(
-                        CONTRACTS["factory"]["address"],
-                        token_a_address,
-                        token_b_address,
-                        stable
-                    )
-                    
+                pool_address = await self._rpc_call(
+                    "get_pool_address",
+                    CONTRACTS["factory"]["address"],
+                    token_a_address,
+                    token_b_address,
+                    stable
+                )
+                
                 if pool_address:
-                    logger.info(f"Found pool at {pool_address} for {token_a}/{token_b} stable={stable}")
+                    logger.info("Found pool at %s for %s/%s stable=%s", pool_address, token_a, token_b, stable)
                     return pool_address
             except Exception as e:
                 logger.warning(f"Failed to query factory: {e}")
             
-            # Fallback to known pools
-            known_pools = {
-                # WETH-USDC volatile (Standard AMM) - verified working
-                (TOKENS["WETH"].lower(), TOKENS["USDC"].lower(), False): "0xcDAc0d6c6C59727a65F871236188350531885C43",
-                (TOKENS["USDC"].lower(), TOKENS["WETH"].lower(), False): "0xcDAc0d6c6C59727a65F871236188350531885C43",
-                
-                # Note: SlipStream pool 0xb2cc224c1c9fee385f8ad6a55b4d94e92359dc59 uses different interface
-                
-                # AERO-USDC volatile (verified working)
-                ("0x940181a94a35a4569e4529a3cdfb74e38fd98631".lower(), TOKENS["USDC"].lower(), False): "0x6cDcb1C4A4D1C3C6d054b27AC5B77e89eAFb971d",
-                (TOKENS["USDC"].lower(), "0x940181a94a35a4569e4529a3cdfb74e38fd98631".lower(), False): "0x6cDcb1C4A4D1C3C6d054b27AC5B77e89eAFb971d",
-                
-                # Add more verified pools as needed
-            }
-            
-            # Check known pools
+            # Fall back to known pools
             pool_key = (token_a_address.lower(), token_b_address.lower(), stable)
-            pool_address = known_pools.get(pool_key)
+            pool_address = _KNOWN_POOLS.get(pool_key)
             if not pool_address:
                 # Check reverse order
                 pool_key = (token_b_address.lower(), token_a_address.lower(), stable)
-                pool_address = known_pools.get(pool_key)
+                pool_address = _KNOWN_POOLS.get(pool_key)
             
             if pool_address:
-                logger.info(f"Using known pool at {pool_address} for {token_a}/{token_b} stable={stable}")
+                logger.info("Using known pool at %s for %s/%s stable=%s", pool_address, token_a, token_b, stable)
                 return pool_address
             else:
                 logger.warning(f"No pool found for {token_a}/{token_b} stable={stable}")
@@ -602,21 +779,8 @@ class BaseClient:
     async def estimate_gas(self, method: str, **kwargs) -> int:
         """Estimate gas for a transaction."""
         try:
-            # Different gas estimates based on method type
-            gas_estimates = {
-                "swap": 250000,
-                "addLiquidity": 350000,
-                "removeLiquidity": 300000,
-                "approve": 50000,
-                "transfer": 65000,
-            }
-            
-            # Get base estimate
-            base_estimate = gas_estimates.get(method, 200000)
-            
-            # Apply gas buffer from settings
-            from config.contracts import GAS_BUFFER
-            return int(base_estimate * GAS_BUFFER)
+            # Buffered estimates are precomputed at import
+            return _GAS_ESTIMATES.get(method, _DEFAULT_GAS_ESTIMATE)
             
         except Exception as e:
             logger.error(f"Failed to estimate gas: {e}")
@@ -649,10 +813,10 @@ class BaseClient:
             
             # Check if valid gauge address
             if result and result != "0x0000000000000000000000000000000000000000":
-                logger.info(f"Found gauge {result} for pool {pool_address}")
+                logger.info("Found gauge %s for pool %s", result, pool_address)
                 return result
             
-            logger.debug(f"No gauge found for pool {pool_address}")
+            logger.debug("No gauge found for pool %s", pool_address)
             return None
             
         except Exception as e:
@@ -672,11 +836,11 @@ class BaseClient:
             if result:
                 # Convert from wei to tokens per second
                 reward_rate = Decimal(result) / Decimal(10**18)
-                logger.debug(f"Gauge {gauge_address} reward rate: {reward_rate:.6f} AERO/sec")
+                logger.debug("Gauge %s reward rate: %.6f AERO/sec", gauge_address, reward_rate)
                 return reward_rate
                 
         except Exception as e:
-            logger.debug(f"Failed to read rewardRate as state variable: {e}")
+            logger.debug("Failed to read rewardRate as state variable: %s", e)
             
             # Fallback: try with AERO token address if state variable fails
             try:
@@ -688,7 +852,7 @@ class BaseClient:
                 
                 if result:
                     reward_rate = Decimal(result) / Decimal(10**18)
-                    logger.debug(f"Gauge {gauge_address} reward rate (with token): {reward_rate:.6f} AERO/sec")
+                    logger.debug("Gauge %s reward rate (with token): %.6f AERO/sec", gauge_address, reward_rate)
                     return reward_rate
                     
             except Exception as e2:
@@ -708,7 +872,7 @@ class BaseClient:
             if result:
                 # LP tokens have 18 decimals
                 total_supply = Decimal(result) / Decimal(10**18)
-                logger.debug(f"Gauge {gauge_address} total supply: {total_supply:.2f}")
+                logger.debug("Gauge %s total supply: %.2f", gauge_address, total_supply)
                 return total_supply
                 
         except Exception as e:
@@ -725,13 +889,13 @@ class BaseClient:
             # Get gauge address
             gauge_address = await self.get_gauge_for_pool(pool_address)
             if not gauge_address:
-                logger.debug(f"No gauge found for pool {pool_address}, emission APR = 0")
+                logger.debug("No gauge found for pool %s, emission APR = 0", pool_address)
                 return Decimal("0")
             
             # Get reward rate (AERO per second)
             reward_rate = await self.get_gauge_reward_rate(gauge_address)
             if reward_rate == 0:
-                logger.debug(f"No active rewards for gauge {gauge_address}")
+                logger.debug("No active rewards for gauge %s", gauge_address)
                 return Decimal("0")
             
             # Get AERO price from AERO/USDC pool
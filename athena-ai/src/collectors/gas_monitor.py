@@ -3,9 +3,11 @@ Gas Price Monitor for Base Chain
 """
 import asyncio
 import logging
+from collections import deque
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, NamedTuple, Optional
 from decimal import Decimal
+from operator import itemgetter
 
 from src.cdp.base_client import BaseClient
 from src.agent.memory import AthenaMemory, MemoryType
@@ -13,6 +15,14 @@ from src.agent.memory import AthenaMemory, MemoryType
 logger = logging.getLogger(__name__)
 
 
+class GasObservation(NamedTuple):
+    """One gas price sample; a tuple row keeps the 24h history compact."""
+    price: Decimal
+    timestamp: datetime
+    hour: int
+    day_of_week: int
+
+
 class GasMonitor:
     """
     Monitors gas prices on Base chain and identifies patterns.
@@ -27,9 +37,14 @@ class GasMonitor:
         self.memory = memory
         self.monitoring = False
         
-        # Gas price history (last 24 hours)
-        self.price_history = []
+        # Gas price history (last 24 hours); deque drops the oldest in O(1)
         self.max_history = 2880  # 24 hours at 30-second intervals
+        self.price_history = deque(maxlen=self.max_history)
+        self._price_sum = Decimal("0")  # Running total of prices in the window
+        
+        # Per-hour-of-day totals over the same window, indexed by UTC hour
+        self._hourly_sums = [Decimal("0")] * 24
+        self._hourly_counts = [0] * 24
         
         # Statistics
         self.stats = {
@@ -68,18 +83,20 @@ class GasMonitor:
         # Get current gas price
         gas_price = await self.base_client.get_gas_price()
         
-        # Record observation
-        observation = {
-            "price": gas_price,
-            "timestamp": datetime.utcnow(),
-            "hour": datetime.utcnow().hour,
-            "day_of_week": datetime.utcnow().weekday(),
-        }
+        # Record observation (single clock read so the fields agree)
+        now = datetime.utcnow()
+        observation = GasObservation(gas_price, now, now.hour, now.weekday())
         
-        # Add to history
+        # Add to history, keeping the running totals in step with the window
+        if len(self.price_history) == self.max_history:
+            evicted = self.price_history[0]
+            self._price_sum -= evicted.price
+            self._hourly_sums[evicted.hour] -= evicted.price
+            self._hourly_counts[evicted.hour] -= 1
         self.price_history.append(observation)
-        if len(self.price_history) > self.max_history:
-            self.price_history.pop(0)
+        self._price_sum += gas_price
+        self._hourly_sums[observation.hour] += gas_price
+        self._hourly_counts[observation.hour] += 1
             
         # Update statistics
         self._update_statistics()
@@ -90,10 +107,10 @@ class GasMonitor:
         # Store in memory if significant change
         if self._is_significant_change(gas_price):
             await self.memory.remember(
-                content=f"Gas price: {gas_price} gwei at {observation['hour']}:00 UTC",
+                content=f"Gas price: {gas_price} gwei at {observation.hour}:00 UTC",
                 memory_type=MemoryType.OBSERVATION,
                 category="gas_optimization",
-                metadata=observation
+                metadata=observation._asdict()
             )
             
     def _update_statistics(self):
@@ -101,10 +118,10 @@ class GasMonitor:
         if not self.price_history:
             return
             
-        prices = [obs["price"] for obs in self.price_history]
+        prices = [obs.price for obs in self.price_history]
         
         self.stats["current_price"] = prices[-1]
-        self.stats["24h_average"] = sum(prices) / len(prices)
+        self.stats["24h_average"] = self._price_sum / len(prices)
         self.stats["24h_min"] = min(prices)
         self.stats["24h_max"] = max(prices)
         
@@ -113,50 +130,43 @@ class GasMonitor:
         
         optimal_hours = set()
         for obs in self.price_history:
-            if obs["price"] <= threshold:
-                optimal_hours.add(obs["hour"])
+            if obs.price <= threshold:
+                optimal_hours.add(obs.hour)
                 
         self.stats["optimal_windows"] = sorted(list(optimal_hours))
         
-    async def _check_patterns(self, observation: Dict):
+    async def _check_patterns(self, observation: GasObservation):
         """Check for gas price patterns."""
         # Pattern 1: Time-based patterns
         if len(self.price_history) > 48:  # At least 24 hours of data
             await self._check_hourly_patterns()
             
         # Pattern 2: Spike detection
-        if self._is_spike(observation["price"]):
+        if self._is_spike(observation.price):
             await self.memory.remember(
-                content=f"Gas spike detected: {observation['price']} gwei (avg: {self.stats['24h_average']})",
+                content=f"Gas spike detected: {observation.price} gwei (avg: {self.stats['24h_average']})",
                 memory_type=MemoryType.PATTERN,
                 category="gas_optimization",
                 metadata={
-                    "spike_ratio": float(observation["price"] / self.stats["24h_average"]),
-                    "timestamp": observation["timestamp"].isoformat()
+                    "spike_ratio": float(observation.price / self.stats["24h_average"]),
+                    "timestamp": observation.timestamp.isoformat()
                 },
                 confidence=0.9
             )
             
     async def _check_hourly_patterns(self):
         """Analyze hourly gas patterns."""
-        hourly_averages = {}
-        
-        # Calculate average gas price by hour
-        for obs in self.price_history:
-            hour = obs["hour"]
-            if hour not in hourly_averages:
-                hourly_averages[hour] = []
-            hourly_averages[hour].append(obs["price"])
-            
-        # Find consistently cheap hours
+        # Find consistently cheap hours from the running per-hour totals
+        cheap_threshold = self.stats["24h_average"] * Decimal("0.8")
         cheap_hours = []
-        for hour, prices in hourly_averages.items():
-            avg_price = sum(prices) / len(prices)
-            if avg_price < self.stats["24h_average"] * Decimal("0.8"):
-                cheap_hours.append((hour, avg_price))
+        for hour, count in enumerate(self._hourly_counts):
+            if count:
+                avg_price = self._hourly_sums[hour] / count
+                if avg_price < cheap_threshold:
+                    cheap_hours.append((hour, avg_price))
                 
         if cheap_hours:
-            cheap_hours.sort(key=lambda x: x[1])  # Sort by price
+            cheap_hours.sort(key=itemgetter(1))  # Sort by price
             pattern = f"Gas consistently cheaper at hours: {[h[0] for h in cheap_hours[:3]]} UTC"
             
             await self.memory.remember(
@@ -175,7 +185,7 @@ class GasMonitor:
         if not self.price_history:
             return True
             
-        last_price = self.price_history[-2]["price"] if len(self.price_history) > 1 else current_price
+        last_price = self.price_history[-2].price if len(self.price_history) > 1 else current_price
         change_ratio = abs(current_price - last_price) / last_price if last_price > 0 else 0
         
         return change_ratio > Decimal("0.1")  # 10% change
@@ -4,16 +4,28 @@ Aerodrome Pool Scanner
 import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 from decimal import Decimal
 
 from src.cdp.base_client import BaseClient
 from src.agent.memory import AthenaMemory, MemoryType
 from src.aerodrome.event_monitor import EventMonitor
 from config.contracts import TOKENS
+from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Major pairs scanned every cycle; shared, so each entry is read-only
+_MAJOR_PAIRS = tuple(MappingProxyType(pair) for pair in (
+    {"token_a": "WETH", "token_b": "USDC", "stable": False},
+    {"token_a": "WETH", "token_b": "DAI", "stable": False},
+    {"token_a": "AERO", "token_b": "USDC", "stable": False},
+    {"token_a": "AERO", "token_b": "WETH", "stable": False},
+    {"token_a": "USDC", "token_b": "DAI", "stable": True},
+    {"token_a": "USDC", "token_b": "USDbC", "stable": True},
+))
+
 
 class PoolScanner:
     """
@@ -23,6 +35,9 @@ class PoolScanner:
     profitable opportunities for liquidity provision and trading.
     """
     
+    # Opportunity buckets, built once instead of re-declared per scan
+    OPPORTUNITY_CATEGORIES = ("high_apr", "high_volume", "new_pools", "imbalanced")
+    
     def __init__(self, base_client: BaseClient, memory: AthenaMemory):
         """Initialize pool scanner."""
         self.base_client = base_client
@@ -34,16 +49,18 @@ class PoolScanner:
         self.last_scan = None
         
         # Top opportunities
-        self.opportunities = {
-            "high_apr": [],
-            "high_volume": [],
-            "new_pools": [],
-            "imbalanced": [],
-        }
+        self.opportunities = self._empty_opportunities()
         
         # Event monitor for volume tracking (temporarily disabled)
         self.event_monitor = None
         
+        # Memory thresholds, read once from settings
+        self.min_apr_for_memory = getattr(settings, 'min_apr_for_memory', 20)
+        self.min_volume_for_memory = getattr(settings, 'min_volume_for_memory', 100000)
+        
+        # Upper bound per pool so one slow RPC can't stall the whole scan
+        self.pool_scan_timeout = settings.pool_scan_timeout
+        
     async def start_scanning(self):
         """Start continuous pool scanning."""
         if self.scanning:
@@ -74,13 +91,15 @@ class PoolScanner:
         # Pre-fetch common token prices to populate cache
         logger.info("Pre-fetching token prices...")
         try:
-            # Fetch prices for major tokens
-            await self.base_client.get_token_price_usd(TOKENS["WETH"])
-            await self.base_client.get_token_price_usd(TOKENS["AERO"])
+            # Fetch prices for major tokens concurrently
             # USDC, DAI, USDbC are stablecoins, will be cached as $1
-            await self.base_client.get_token_price_usd(TOKENS["USDC"])
-            await self.base_client.get_token_price_usd(TOKENS["DAI"])
-            await self.base_client.get_token_price_usd(TOKENS["USDbC"])
+            await asyncio.wait_for(
+                asyncio.gather(*(
+                    self.base_client.get_token_price_usd(TOKENS[symbol])
+                    for symbol in ("WETH", "AERO", "USDC", "DAI", "USDbC")
+                )),
+                timeout=self.pool_scan_timeout
+            )
             logger.info("Token prices cached successfully")
         except Exception as e:
             logger.error(f"Error pre-fetching token prices: {e}")
@@ -108,16 +127,15 @@ class PoolScanner:
         pairs_to_scan = self._get_pairs_to_scan()
         
         # Scan each pair
-        new_opportunities = {
-            "high_apr": [],
-            "high_volume": [],
-            "new_pools": [],
-            "imbalanced": [],
-        }
+        new_opportunities = self._empty_opportunities()
         
-        for pair in pairs_to_scan:
-            pool_data = await self._scan_pool(pair["token_a"], pair["token_b"], pair["stable"])
-            
+        # One timestamp for the whole pass, so pools from the same scan line up
+        scan_time = datetime.utcnow()
+        
+        # Pools are independent, so scan them concurrently with a per-pool timeout
+        # and categorize each one as soon as it finishes
+        for scan in asyncio.as_completed([self._scan_pair(pair, scan_time) for pair in pairs_to_scan]):
+            pool_data = await scan
             if pool_data:
                 # Categorize opportunity
                 await self._categorize_opportunity(pool_data, new_opportunities)
@@ -129,22 +147,31 @@ class PoolScanner:
         # Store significant findings in memory
         await self._store_findings(new_opportunities)
         
-    def _get_pairs_to_scan(self) -> List[Dict]:
+    async def _scan_pair(self, pair: Mapping, scan_time: datetime) -> Optional[Dict]:
+        """Scan one pair within the per-pool timeout, logging any failure."""
+        try:
+            return await asyncio.wait_for(
+                self._scan_pool(pair["token_a"], pair["token_b"], pair["stable"], scan_time),
+                timeout=self.pool_scan_timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Timed out scanning pool {pair['token_a']}/{pair['token_b']} after {self.pool_scan_timeout}s")
+        except Exception as e:
+            logger.error(f"Error scanning pool {pair['token_a']}/{pair['token_b']}: {e}")
+        return None
+        
+    def _empty_opportunities(self) -> Dict[str, List[Dict]]:
+        """Create an empty opportunity bucket per category."""
+        return {category: [] for category in self.OPPORTUNITY_CATEGORIES}
+        
+    def _get_pairs_to_scan(self) -> Tuple[Mapping, ...]:
         """Get list of pairs to scan."""
         # Focus on major pairs
-        major_pairs = [
-            {"token_a": "WETH", "token_b": "USDC", "stable": False},
-            {"token_a": "WETH", "token_b": "DAI", "stable": False},
-            {"token_a": "AERO", "token_b": "USDC", "stable": False},
-            {"token_a": "AERO", "token_b": "WETH", "stable": False},
-            {"token_a": "USDC", "token_b": "DAI", "stable": True},
-            {"token_a": "USDC", "token_b": "USDbC", "stable": True},
-        ]
-        
-        return major_pairs
-        
-    async def _scan_pool(self, token_a: str, token_b: str, stable: bool) -> Optional[Dict]:
-        """Scan a specific pool."""
+        return _MAJOR_PAIRS
+        
+    async def _scan_pool(self, token_a: str, token_b: str, stable: bool,
+                         scan_time: Optional[datetime] = None) -> Optional[Dict]:
+        """Scan a specific pool, stamping it with the scan pass time."""
         try:
             # Get pool info
             pool_info = await self.base_client.get_pool_info(token_a, token_b, stable)
@@ -156,7 +183,7 @@ class PoolScanner:
             pool_address = pool_info.get("address")
             volume_24h = await self._get_real_volume(pool_info)
             total_apr, fee_apr, emission_apr = await self._calculate_real_apr(
-                pool_info, pool_address, stable
+                pool_info, pool_address, stable, volume_24h
             )
             
             # Use real data from CDP
@@ -175,14 +202,15 @@ class PoolScanner:
                 },
                 "ratio": pool_info.get("ratio", Decimal("1")),
                 "imbalanced": pool_info.get("imbalanced", False),
-                "timestamp": datetime.utcnow(),
+                "timestamp": scan_time or datetime.utcnow(),
             }
             
             # Store in cache
             pool_key = f"{token_a}/{token_b}-{stable}"
             self.pools[pool_key] = pool_data
             
-            logger.debug(f"Scanned pool {pool_key}: address={pool_data.get('address')}, APR={pool_data.get('apr')}%, TVL=${pool_data.get('tvl'):,.0f}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Scanned pool {pool_key}: address={pool_data.get('address')}, APR={pool_data.get('apr')}%, TVL=${pool_data.get('tvl'):,.0f}")
             
             return pool_data
             
@@ -205,7 +233,8 @@ class PoolScanner:
         annual_fees = daily_fees * Decimal("365")
         fee_apr = (annual_fees / tvl) * Decimal("100")
         
-        logger.debug(f"Fee APR calculation: volume=${volume_24h:,.0f}, TVL=${tvl:,.0f}, fee_rate={fee_rate}, APR={fee_apr:.2f}%")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Fee APR calculation: volume=${volume_24h:,.0f}, TVL=${tvl:,.0f}, fee_rate={fee_rate}, APR={fee_apr:.2f}%")
         
         return fee_apr
     
@@ -214,7 +243,8 @@ class PoolScanner:
         if self.event_monitor and pool_info.get("address"):
             real_volume = self.event_monitor.get_24h_volume(pool_info["address"])
             if real_volume > 0:
-                logger.info(f"Real 24h volume for {pool_info['address']}: ${real_volume:,.0f}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"Real 24h volume for {pool_info['address']}: ${real_volume:,.0f}")
                 return real_volume
         
         # Temporary estimation while event monitor is disabled
@@ -223,14 +253,22 @@ class PoolScanner:
         if tvl > 0:
             # Conservative estimate: 20% of TVL for active pools
             estimated_volume = tvl * Decimal("0.2")
-            logger.debug(f"Estimated volume for {pool_info.get('address', 'unknown')}: ${estimated_volume:,.0f} (20% of TVL)")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Estimated volume for {pool_info.get('address', 'unknown')}: ${estimated_volume:,.0f} (20% of TVL)")
             return estimated_volume
         
         return Decimal("0")
     
-    async def _calculate_real_apr(self, pool_info: Dict, pool_address: str, stable: bool) -> Tuple[Decimal, Decimal, Decimal]:
+    async def _calculate_real_apr(self, pool_info: Dict, pool_address: str, stable: bool,
+                                  volume_24h: Decimal) -> Tuple[Decimal, Decimal, Decimal]:
         """Calculate real APR from pool data and gauge emissions.
         
+        Args:
+            pool_info: Pool info from the CDP client
+            pool_address: Pool contract address
+            stable: Whether the pool is stable
+            volume_24h: 24h volume already looked up by the caller
+            
         Returns:
             Tuple of (total_apr, fee_apr, emission_apr)
         """
@@ -239,7 +277,6 @@ class PoolScanner:
             return Decimal("0"), Decimal("0"), Decimal("0")
             
         # Calculate fee APR from actual volume only
-        volume_24h = await self._get_real_volume(pool_info)
         fee_apr = self._calculate_fee_apr(volume_24h, tvl, stable)
         
         # Get real emission APR using CDP client
@@ -248,7 +285,7 @@ class PoolScanner:
             try:
                 emission_apr = await self.base_client.calculate_emission_apr(pool_address, tvl)
                 if emission_apr > 0:
-                    logger.info(f"Real emission APR for {pool_address}: {emission_apr:.2f}%")
+                    logger.info("Real emission APR for %s: %.2f%%", pool_address, emission_apr)
             except Exception as e:
                 logger.error(f"Failed to get emission APR for {pool_address}: {e}")
         
@@ -274,7 +311,7 @@ class PoolScanner:
                 if aero_reserve > 0:
                     # Price = USDC per AERO
                     aero_price = usdc_reserve / aero_reserve
-                    logger.info(f"Real AERO price from DEX: ${aero_price:.4f}")
+                    logger.info("Real AERO price from DEX: $%.4f", aero_price)
                     return aero_price
                     
         except Exception as e:
@@ -322,13 +359,28 @@ class PoolScanner:
         # Consider imbalanced if ratio deviates more than 10% from 1:1
         return abs(ratio - Decimal("1")) > Decimal("0.1")
         
+    @staticmethod
+    def _observation_base(pool: Dict, category: str, confidence: float) -> Dict:
+        """Build the fields shared by every stored pool observation."""
+        timestamp = pool.get("timestamp")
+        return {
+            "type": "observation",
+            "category": category,
+            "timestamp": timestamp.isoformat() if isinstance(timestamp, datetime) else timestamp,
+            "confidence": confidence,
+            "pool": pool["pair"],
+            "pool_address": pool.get("address"),
+            "tvl": float(pool.get("tvl", 0)),
+            "stable": pool.get("stable", False),
+            "imbalanced": pool.get("imbalanced", False),
+            "ratio": float(pool.get("ratio", 1)),
+            "reserves": {k: float(v) for k, v in pool.get("reserves", {}).items()},
+        }
+        
     async def _store_findings(self, opportunities: Dict):
         """Store significant findings in memory - enhanced to capture all significant pools."""
-        from config.settings import settings
-        
-        # Get thresholds from settings or use defaults
-        min_apr_for_memory = getattr(settings, 'min_apr_for_memory', 20)
-        min_volume_for_memory = getattr(settings, 'min_volume_for_memory', 100000)
+        min_apr_for_memory = self.min_apr_for_memory
+        min_volume_for_memory = self.min_volume_for_memory
         
         # First, store ALL pools that meet basic criteria (not just categorized opportunities)
         # This ensures we don't miss pools with APR between 20-50%
@@ -336,22 +388,12 @@ class PoolScanner:
             # Store any pool with meaningful APR or volume
             if pool_data.get("apr", 0) >= min_apr_for_memory or pool_data.get("volume_24h", 0) >= min_volume_for_memory:
                 # Create consistent observation structure
-                observation = {
-                    "type": "observation",
-                    "category": "pool_analysis",  # Use general category
-                    "timestamp": pool_data.get("timestamp", datetime.utcnow()).isoformat() if isinstance(pool_data.get("timestamp"), datetime) else pool_data.get("timestamp"),
-                    "confidence": 0.8,
-                    "pool": pool_data["pair"],
-                    "pool_address": pool_data.get("address"),
-                    "tvl": float(pool_data.get("tvl", 0)),
+                observation = self._observation_base(pool_data, "pool_analysis", 0.8)  # Use general category
+                observation |= {
                     "apr": float(pool_data.get("apr", 0)),
                     "fee_apr": float(pool_data.get("fee_apr", 0)),
                     "incentive_apr": float(pool_data.get("incentive_apr", 0)),
                     "volume_24h": float(pool_data.get("volume_24h", 0)),
-                    "stable": pool_data.get("stable", False),
-                    "imbalanced": pool_data.get("imbalanced", False),
-                    "ratio": float(pool_data.get("ratio", 1)),
-                    "reserves": {k: float(v) for k, v in pool_data.get("reserves", {}).items()},
                 }
                 
                 await self.memory.remember(
@@ -361,28 +403,18 @@ class PoolScanner:
                     metadata=observation,
                     confidence=observation["confidence"]
                 )
-                logger.info(f"Stored pool data for {pool_data['pair']} with APR {pool_data.get('apr', 0):.2f}%")
+                logger.info("Stored pool data for %s with APR %.2f%%", pool_data['pair'], pool_data.get('apr', 0))
         
         # Store ALL high APR pools, not just the top one
         if opportunities["high_apr"]:
             for pool in opportunities["high_apr"]:
                 if pool["apr"] >= min_apr_for_memory:
                     # Create consistent observation structure
-                    observation = {
-                        "type": "observation",
-                        "category": "pool_behavior",
-                        "timestamp": pool.get("timestamp", datetime.utcnow()).isoformat() if isinstance(pool.get("timestamp"), datetime) else pool.get("timestamp"),
-                        "confidence": 0.9 if pool["apr"] > 50 else 0.7,
-                        "pool": pool["pair"],
-                        "pool_address": pool.get("address"),
-                        "tvl": float(pool["tvl"]),
+                    observation = self._observation_base(pool, "pool_behavior", 0.9 if pool["apr"] > 50 else 0.7)
+                    observation |= {
                         "apr": float(pool["apr"]),
                         "fee_apr": float(pool.get("fee_apr", 0)),
                         "incentive_apr": float(pool.get("incentive_apr", 0)),
-                        "stable": pool.get("stable", False),
-                        "imbalanced": pool.get("imbalanced", False),
-                        "ratio": float(pool.get("ratio", 1)),
-                        "reserves": {k: float(v) for k, v in pool.get("reserves", {}).items()},
                     }
                     
                     await self.memory.remember(
@@ -398,21 +430,11 @@ class PoolScanner:
             for pool in opportunities["high_volume"]:
                 if pool["volume_24h"] >= min_volume_for_memory:
                     # Create consistent observation structure
-                    observation = {
-                        "type": "observation",
-                        "category": "pool_behavior",
-                        "timestamp": pool.get("timestamp", datetime.utcnow()).isoformat() if isinstance(pool.get("timestamp"), datetime) else pool.get("timestamp"),
-                        "confidence": 0.9 if pool["volume_24h"] > 1000000 else 0.8,
-                        "pool": pool["pair"],
-                        "pool_address": pool.get("address"),
-                        "tvl": float(pool["tvl"]),
+                    observation = self._observation_base(pool, "pool_behavior", 0.9 if pool["volume_24h"] > 1000000 else 0.8)
+                    observation |= {
                         "volume_24h": float(pool["volume_24h"]),
                         "apr": float(pool["apr"]),
                         "volume_to_tvl_ratio": float(pool["volume_24h"] / pool["tvl"]) if pool["tvl"] > 0 else 0,
-                        "stable": pool.get("stable", False),
-                        "imbalanced": pool.get("imbalanced", False),
-                        "ratio": float(pool.get("ratio", 1)),
-                        "reserves": {k: float(v) for k, v in pool.get("reserves", {}).items()},
                     }
                     
                     await self.memory.remember(
@@ -429,19 +451,8 @@ class PoolScanner:
                 # Only store significantly imbalanced pools
                 if pool.get("ratio") and (pool["ratio"] > 2 or pool["ratio"] < 0.5):
                     # Create consistent observation structure
-                    observation = {
-                        "type": "observation",
-                        "category": "arbitrage_opportunity",
-                        "timestamp": pool.get("timestamp", datetime.utcnow()).isoformat() if isinstance(pool.get("timestamp"), datetime) else pool.get("timestamp"),
-                        "confidence": 0.8,
-                        "pool": pool["pair"],
-                        "pool_address": pool.get("address"),
-                        "tvl": float(pool["tvl"]),
-                        "ratio": float(pool["ratio"]),
-                        "stable": pool.get("stable", False),
-                        "imbalanced": True,
-                        "reserves": {k: float(v) for k, v in pool.get("reserves", {}).items()},
-                    }
+                    observation = self._observation_base(pool, "arbitrage_opportunity", 0.8)
+                    observation["imbalanced"] = True
                     
                     await self.memory.remember(
                         content=f"Imbalanced pool detected: {pool['pair']} with ratio {pool['ratio']:.4f}",
@@ -492,10 +503,8 @@ class PoolScanner:
             "last_scan": self.last_scan.isoformat() if self.last_scan else None,
             "pools_tracked": len(self.pools),
             "opportunities": {
-                "high_apr": len(self.opportunities["high_apr"]),
-                "high_volume": len(self.opportunities["high_volume"]),
-                "new_pools": len(self.opportunities["new_pools"]),
-                "imbalanced": len(self.opportunities["imbalanced"]),
+                category: len(self.opportunities[category])
+                for category in self.OPPORTUNITY_CATEGORIES
             },
             "top_apr": max(
                 (p["apr"] for p in self.pools.values()),
@@ -1,88 +1,180 @@
 """
 Firestore client for persistent storage
 """
+import copy
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from google.cloud import firestore
 from google.cloud.firestore_v1.base_query import FieldFilter
 from decimal import Decimal
 
 logger = logging.getLogger(__name__)
 
+# Firestore caps a single WriteBatch at 500 writes
+MAX_BATCH_WRITES = 500
+
+# How long high-confidence pattern lookups are reused (seconds)
+PATTERN_CACHE_TTL = 300
+
+# Values Firestore stores natively; returned from _clean_for_firestore untouched
+_PASSTHROUGH_TYPES = frozenset({str, int, float, bool, type(None), datetime})
+
 
 class FirestoreClient:
     """Client for interacting with Firestore."""
     
     def __init__(self, project_id: str):
-        """Initialize Firestore client."""
-        self.db = firestore.Client(project=project_id)
+        """Initialize Firestore client.
+        
+        Uses the native asyncio client, so reads and writes are awaited
+        on the event loop instead of blocking it or a worker thread.
+        """
+        self.db = firestore.AsyncClient(project=project_id)
+        
+        # Fixed documents/collections, resolved once and reused per write
+        self._agent_state_ref = self.db.collection('agent_state').document('current')
+        self._performance_ref = self.db.collection('performance').document('summary')
+        self._observation_metrics_ref = self.db.collection('observation_metrics').document('current')
+        self._cycles = self.db.collection('cycles')
+        self._pool_profiles = self.db.collection('pool_profiles')
+        self._positions = self.db.collection('positions')
+        self._observed_patterns = self.db.collection('observed_patterns')
+        self._pattern_confidence = self.db.collection('pattern_confidence')
+        self._pool_metrics = self.db.collection('pool_metrics')
+        self._pattern_correlations = self.db.collection('pattern_correlations')
+        
+        # Query templates; Firestore queries are immutable, so each call
+        # only binds its variable filters onto these shared bases
+        self._active_positions_query = self._positions.where(
+            filter=FieldFilter('status', '==', 'active')
+        )
+        self._recent_pool_metrics_query = self._pool_metrics.order_by(
+            'timestamp', direction=firestore.Query.DESCENDING
+        )
+        
+        # min_confidence -> (expires_at, patterns); cleared when confidences change
+        self._pattern_cache: Dict[float, Tuple[float, List[Dict[str, Any]]]] = {}
         logger.info(f"Firestore client initialized for project: {project_id}")
         
-    def save_agent_state(self, state: Dict[str, Any]) -> None:
+    async def save_agent_state(self, state: Dict[str, Any]) -> None:
         """Save current agent state."""
         try:
-            doc_ref = self.db.collection('agent_state').document('current')
+            doc_ref = self._agent_state_ref
             
             # Convert Decimal to float for Firestore
             clean_state = self._clean_for_firestore(state)
-            clean_state['last_update'] = datetime.utcnow()
+            clean_state['last_update'] = firestore.SERVER_TIMESTAMP
             
-            doc_ref.set(clean_state)
+            await doc_ref.set(clean_state)
             logger.info("Agent state saved to Firestore")
         except Exception as e:
             logger.error(f"Failed to save agent state: {e}")
             
-    def save_cycle_result(self, cycle_number: int, result: Dict[str, Any]) -> None:
+    async def save_cycle_result(self, cycle_number: int, result: Dict[str, Any]) -> None:
         """Save reasoning cycle result."""
         try:
-            doc_ref = self.db.collection('cycles').document(f'cycle_{cycle_number}')
+            doc_ref = self._cycles.document(f'cycle_{cycle_number}')
             
             clean_result = self._clean_for_firestore(result)
             clean_result['cycle_number'] = cycle_number
-            clean_result['timestamp'] = datetime.utcnow()
+            clean_result['timestamp'] = firestore.SERVER_TIMESTAMP
             
-            doc_ref.set(clean_result)
+            await doc_ref.set(clean_result)
             logger.info(f"Cycle {cycle_number} result saved")
         except Exception as e:
             logger.error(f"Failed to save cycle result: {e}")
             
-    def save_position(self, position: Dict[str, Any]) -> str:
+    async def save_cycle_snapshot(self,
+                            cycle_number: int,
+                            state: Dict[str, Any],
+                            result: Dict[str, Any],
+                            performance: Optional[Dict[str, Any]],
+                            observation_metrics: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Save everything produced by one reasoning cycle in a single commit.
+        
+        Writes the agent state, cycle result, performance summary and
+        (optionally) observation metrics through one WriteBatch, so the
+        cycle costs one round trip and the documents never disagree.
+        Timestamps use the server commit time, so every document in the
+        batch gets the same value.
+        
+        Args:
+            cycle_number: Reasoning cycle number
+            state: Agent state fields that changed; merged into the current document
+            result: Cycle result
+            performance: Performance metrics, or None if unchanged since the last
+                committed save
+            observation_metrics: Observation period metrics, if observing
+            
+        Returns:
+            True if the batch was committed
+        """
+        try:
+            batch = self.db.batch()
+            
+            clean_state = self._clean_for_firestore(state)
+            clean_state['last_update'] = firestore.SERVER_TIMESTAMP
+            batch.set(self._agent_state_ref, clean_state, merge=True)
+            
+            clean_result = self._clean_for_firestore(result)
+            clean_result['cycle_number'] = cycle_number
+            clean_result['timestamp'] = firestore.SERVER_TIMESTAMP
+            batch.set(self._cycles.document(f'cycle_{cycle_number}'), clean_result)
+            
+            if performance is not None:
+                clean_performance = self._clean_for_firestore(performance)
+                clean_performance['last_update'] = firestore.SERVER_TIMESTAMP
+                batch.set(self._performance_ref, clean_performance, merge=True)
+            
+            if observation_metrics is not None:
+                clean_metrics = self._clean_for_firestore(observation_metrics)
+                clean_metrics['last_update'] = firestore.SERVER_TIMESTAMP
+                batch.set(self._observation_metrics_ref, clean_metrics, merge=True)
+                
+            await batch.commit()
+            logger.info(f"Cycle {cycle_number} snapshot saved")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save cycle snapshot: {e}")
+            return False
+            
+    async def save_position(self, position: Dict[str, Any]) -> str:
         """Save a new position."""
         try:
             clean_position = self._clean_for_firestore(position)
-            clean_position['created_at'] = datetime.utcnow()
+            clean_position['created_at'] = firestore.SERVER_TIMESTAMP
             clean_position['status'] = 'active'
             
-            doc_ref = self.db.collection('positions').add(clean_position)[1]
+            doc_ref = (await self._positions.add(clean_position))[1]
             logger.info(f"Position saved with ID: {doc_ref.id}")
             return doc_ref.id
         except Exception as e:
             logger.error(f"Failed to save position: {e}")
             return ""
             
-    def update_performance(self, metrics: Dict[str, Any]) -> None:
+    async def update_performance(self, metrics: Dict[str, Any]) -> None:
         """Update performance metrics."""
         try:
-            doc_ref = self.db.collection('performance').document('summary')
+            doc_ref = self._performance_ref
             
             clean_metrics = self._clean_for_firestore(metrics)
-            clean_metrics['last_update'] = datetime.utcnow()
+            clean_metrics['last_update'] = firestore.SERVER_TIMESTAMP
             
-            doc_ref.set(clean_metrics, merge=True)
+            await doc_ref.set(clean_metrics, merge=True)
             logger.info("Performance metrics updated")
         except Exception as e:
             logger.error(f"Failed to update performance: {e}")
             
-    def get_active_positions(self) -> List[Dict[str, Any]]:
+    async def get_active_positions(self) -> List[Dict[str, Any]]:
         """Get all active positions."""
         try:
             positions = []
-            docs = self.db.collection('positions').where(
-                filter=FieldFilter('status', '==', 'active')
-            ).stream()
+            docs = self._active_positions_query.stream()
             
-            for doc in docs:
+            async for doc in docs:
                 position = doc.to_dict()
                 position['id'] = doc.id
                 positions.append(position)
@@ -92,9 +184,30 @@ class FirestoreClient:
             logger.error(f"Failed to get positions: {e}")
             return []
             
+    async def _commit_in_chunks(self, writes: Iterable[Tuple[Any, Dict[str, Any]]]) -> None:
+        """Commit (document reference, data) set-writes in as few batches as possible.
+        
+        Args:
+            writes: Document references paired with the data to set on them
+        """
+        batch = self.db.batch()
+        pending = 0
+        for doc_ref, data in writes:
+            batch.set(doc_ref, data)
+            pending += 1
+            if pending == MAX_BATCH_WRITES:
+                await batch.commit()
+                batch = self.db.batch()
+                pending = 0
+        if pending:
+            await batch.commit()
+            
     def _clean_for_firestore(self, data: Any) -> Any:
         """Clean data for Firestore storage."""
-        if isinstance(data, dict):
+        # Fast path for the common leaf values: one set lookup instead of a chain of checks
+        if type(data) in _PASSTHROUGH_TYPES:
+            return data
+        elif isinstance(data, dict):
             return {k: self._clean_for_firestore(v) for k, v in data.items()}
         elif isinstance(data, list):
             return [self._clean_for_firestore(item) for item in data]
@@ -105,26 +218,61 @@ class FirestoreClient:
         else:
             return data
             
-    def save_pattern(self, pattern: Dict[str, Any]) -> str:
+    async def save_pattern(self, pattern: Dict[str, Any]) -> str:
         """Save a discovered pattern during observation."""
         try:
             clean_pattern = self._clean_for_firestore(pattern)
-            clean_pattern['discovered_at'] = datetime.utcnow()
+            clean_pattern['discovered_at'] = firestore.SERVER_TIMESTAMP
             
-            doc_ref = self.db.collection('observed_patterns').add(clean_pattern)[1]
+            doc_ref = (await self._observed_patterns.add(clean_pattern))[1]
             logger.info(f"Pattern saved with ID: {doc_ref.id}")
             return doc_ref.id
         except Exception as e:
             logger.error(f"Failed to save pattern: {e}")
             return ""
             
-    def update_pattern_confidence(self, pattern_id: str, confidence: float, success: bool) -> None:
+    async def save_patterns(self, patterns: List[Dict[str, Any]]) -> List[str]:
+        """Save several discovered patterns in one batched commit.
+        
+        Args:
+            patterns: Pattern documents to store
+            
+        Returns:
+            One document ID per pattern, in input order, or an empty list
+            on failure. The result is all-or-nothing: when a later batch
+            fails, patterns in earlier batches may already be stored, but
+            no IDs are returned for them.
+        """
+        if not patterns:
+            return []
+            
+        try:
+            collection = self._observed_patterns
+            writes = []
+            pattern_ids = []
+            
+            for pattern in patterns:
+                clean_pattern = self._clean_for_firestore(pattern)
+                clean_pattern['discovered_at'] = firestore.SERVER_TIMESTAMP
+                doc_ref = collection.document()
+                writes.append((doc_ref, clean_pattern))
+                pattern_ids.append(doc_ref.id)
+                
+            await self._commit_in_chunks(writes)
+            self._pattern_cache.clear()
+            logger.info(f"Saved {len(pattern_ids)} patterns")
+            return pattern_ids
+        except Exception as e:
+            logger.error(f"Failed to save patterns: {e}")
+            return []
+            
+    async def update_pattern_confidence(self, pattern_id: str, confidence: float, success: bool) -> None:
         """Update pattern confidence based on outcomes."""
         try:
-            doc_ref = self.db.collection('pattern_confidence').document(pattern_id)
+            doc_ref = self._pattern_confidence.document(pattern_id)
             
             # Get existing data or create new
-            doc = doc_ref.get()
+            doc = await doc_ref.get()
             if doc.exists:
                 data = doc.to_dict()
                 occurrences = data.get('occurrences', 0) + 1
@@ -136,79 +284,114 @@ class FirestoreClient:
             # Update confidence
             new_confidence = successes / occurrences
             
-            doc_ref.set({
+            await doc_ref.set({
                 'pattern_id': pattern_id,
                 'confidence': new_confidence,
                 'occurrences': occurrences,
                 'successes': successes,
-                'last_update': datetime.utcnow()
+                'last_update': firestore.SERVER_TIMESTAMP
             })
             
-            logger.info(f"Pattern {pattern_id} confidence updated to {new_confidence:.2f}")
+            self._pattern_cache.clear()
+            logger.info("Pattern %s confidence updated to %.2f", pattern_id, new_confidence)
         except Exception as e:
             logger.error(f"Failed to update pattern confidence: {e}")
             
-    def save_observation_metrics(self, metrics: Dict[str, Any]) -> None:
+    async def save_observation_metrics(self, metrics: Dict[str, Any]) -> None:
         """Save observation period metrics."""
         try:
-            doc_ref = self.db.collection('observation_metrics').document('current')
+            doc_ref = self._observation_metrics_ref
             
             clean_metrics = self._clean_for_firestore(metrics)
-            clean_metrics['last_update'] = datetime.utcnow()
+            clean_metrics['last_update'] = firestore.SERVER_TIMESTAMP
             
-            doc_ref.set(clean_metrics, merge=True)
+            await doc_ref.set(clean_metrics, merge=True)
             logger.info("Observation metrics saved")
         except Exception as e:
             logger.error(f"Failed to save observation metrics: {e}")
             
-    def get_high_confidence_patterns(self, min_confidence: float = 0.7) -> List[Dict[str, Any]]:
-        """Get patterns with high confidence scores."""
+    async def get_high_confidence_patterns(self, min_confidence: float = 0.7) -> List[Dict[str, Any]]:
+        """Get patterns with high confidence scores.
+        
+        Results are cached for PATTERN_CACHE_TTL seconds so repeated
+        decision cycles don't re-run the query and batched read. Callers
+        get their own copy, so mutating it can't corrupt the cache.
+        """
+        cached = self._pattern_cache.get(min_confidence)
+        if cached and cached[0] > time.monotonic():
+            return copy.deepcopy(cached[1])
+            
         try:
             patterns = []
             
             # Get pattern confidence scores
-            confidence_docs = self.db.collection('pattern_confidence').where(
+            confidence_docs = self._pattern_confidence.where(
                 filter=FieldFilter('confidence', '>=', min_confidence)
             ).stream()
             
             pattern_ids = []
             confidence_map = {}
             
-            for doc in confidence_docs:
+            async for doc in confidence_docs:
                 data = doc.to_dict()
                 pattern_ids.append(data['pattern_id'])
                 confidence_map[data['pattern_id']] = data['confidence']
             
-            # Get actual patterns
+            # Get actual patterns in one batched read
             if pattern_ids:
-                for pattern_id in pattern_ids:
-                    pattern_doc = self.db.collection('observed_patterns').document(pattern_id).get()
+                refs = [self._observed_patterns.document(pattern_id) for pattern_id in pattern_ids]
+                async for pattern_doc in self.db.get_all(refs):
                     if pattern_doc.exists:
                         pattern = pattern_doc.to_dict()
-                        pattern['id'] = pattern_id
-                        pattern['confidence'] = confidence_map[pattern_id]
+                        pattern['id'] = pattern_doc.id
+                        pattern['confidence'] = confidence_map[pattern_doc.id]
                         patterns.append(pattern)
                         
-            return patterns
+            self._pattern_cache[min_confidence] = (time.monotonic() + PATTERN_CACHE_TTL, patterns)
+            return copy.deepcopy(patterns)
         except Exception as e:
             logger.error(f"Failed to get high confidence patterns: {e}")
             return []
             
-    def save_pool_profile(self, pool_address: str, profile_data: Dict[str, Any]) -> None:
+    async def save_pool_profile(self, pool_address: str, profile_data: Dict[str, Any]) -> None:
         """Save or update a pool profile."""
         try:
             clean_data = self._clean_for_firestore(profile_data)
-            clean_data['updated_at'] = datetime.utcnow()
+            clean_data['updated_at'] = firestore.SERVER_TIMESTAMP
             
-            self.db.collection('pool_profiles').document(pool_address).set(clean_data)
-            logger.info(f"Pool profile saved for {pool_address}")
+            await self._pool_profiles.document(pool_address).set(clean_data)
+            logger.info("Pool profile saved for %s", pool_address)
         except Exception as e:
             logger.error(f"Failed to save pool profile: {e}")
             
-    def get_pool_profile(self, pool_address: str) -> Optional[Dict[str, Any]]:
+    async def save_pool_profiles(self, profiles: Dict[str, Dict[str, Any]], prevalidated: bool = False) -> None:
+        """Save several pool profiles with batched commits.
+        
+        Args:
+            profiles: Profile documents keyed by pool address
+            prevalidated: True when the documents already hold only
+                Firestore-native values (e.g. PoolProfile.to_dict()), so the
+                recursive _clean_for_firestore pass can be skipped
+        """
+        try:
+            writes = []
+            for pool_address, profile_data in profiles.items():
+                if prevalidated:
+                    clean_data = dict(profile_data)
+                else:
+                    clean_data = self._clean_for_firestore(profile_data)
+                clean_data['updated_at'] = firestore.SERVER_TIMESTAMP
+                writes.append((self._pool_profiles.document(pool_address), clean_data))
+                
+            await self._commit_in_chunks(writes)
+            logger.info(f"Saved {len(writes)} pool profiles")
+        except Exception as e:
+            logger.error(f"Failed to save pool profiles: {e}")
+            
+    async def get_pool_profile(self, pool_address: str) -> Optional[Dict[str, Any]]:
         """Get a specific pool profile."""
         try:
-            doc = self.db.collection('pool_profiles').document(pool_address).get()
+            doc = await self._pool_profiles.document(pool_address).get()
             if doc.exists:
                 return doc.to_dict()
             return None
@@ -216,46 +399,48 @@ class FirestoreClient:
             logger.error(f"Failed to get pool profile: {e}")
             return None
             
-    def get_all_pool_profiles(self) -> Dict[str, Dict[str, Any]]:
+    async def get_all_pool_profiles(self) -> Dict[str, Dict[str, Any]]:
         """Get all pool profiles."""
         try:
             profiles = {}
-            docs = self.db.collection('pool_profiles').stream()
-            for doc in docs:
+            docs = self._pool_profiles.stream()
+            async for doc in docs:
                 profiles[doc.id] = doc.to_dict()
             return profiles
         except Exception as e:
             logger.error(f"Failed to get all pool profiles: {e}")
             return {}
             
-    def save_pool_metrics(self, pool_address: str, metrics: Dict[str, Any]) -> str:
+    async def save_pool_metrics(self, pool_address: str, metrics: Dict[str, Any]) -> str:
         """Save pool metrics time-series data."""
         try:
             clean_metrics = self._clean_for_firestore(metrics)
             clean_metrics['pool_address'] = pool_address
-            clean_metrics['timestamp'] = datetime.utcnow()
+            clean_metrics['timestamp'] = firestore.SERVER_TIMESTAMP
             
             # Store in pool_metrics collection with auto-generated ID
-            doc_ref = self.db.collection('pool_metrics').add(clean_metrics)[1]
-            logger.info(f"Pool metrics saved for {pool_address} with ID: {doc_ref.id}")
+            doc_ref = (await self._pool_metrics.add(clean_metrics))[1]
+            logger.info("Pool metrics saved for %s with ID: %s", pool_address, doc_ref.id)
             return doc_ref.id
         except Exception as e:
             logger.error(f"Failed to save pool metrics: {e}")
             return ""
             
-    def get_pool_metrics(self, pool_address: str, hours: int = 24) -> List[Dict[str, Any]]:
+    async def get_pool_metrics(self, pool_address: str, hours: int = 24) -> List[Dict[str, Any]]:
         """Get pool metrics for the last N hours."""
         try:
             cutoff_time = datetime.utcnow() - timedelta(hours=hours)
             
-            docs = (self.db.collection('pool_metrics')
-                   .where('pool_address', '==', pool_address)
-                   .where('timestamp', '>=', cutoff_time)
-                   .order_by('timestamp', direction=firestore.Query.DESCENDING)
+            # Served by the composite index (pool_address ASC, timestamp DESC);
+            # timestamps are stored as native Firestore Timestamps, so the
+            # range filter compares like with like
+            docs = (self._recent_pool_metrics_query
+                   .where(filter=FieldFilter('pool_address', '==', pool_address))
+                   .where(filter=FieldFilter('timestamp', '>=', cutoff_time))
                    .stream())
                    
             metrics = []
-            for doc in docs:
+            async for doc in docs:
                 metric_data = doc.to_dict()
                 metric_data['id'] = doc.id
                 metrics.append(metric_data)
@@ -265,28 +450,28 @@ class FirestoreClient:
             logger.error(f"Failed to get pool metrics: {e}")
             return []
             
-    def save_pattern_correlation(self, correlation_data: Dict[str, Any]) -> str:
+    async def save_pattern_correlation(self, correlation_data: Dict[str, Any]) -> str:
         """Save cross-pool pattern correlation."""
         try:
             clean_data = self._clean_for_firestore(correlation_data)
-            clean_data['discovered_at'] = datetime.utcnow()
+            clean_data['discovered_at'] = firestore.SERVER_TIMESTAMP
             
-            doc_ref = self.db.collection('pattern_correlations').add(clean_data)[1]
-            logger.info(f"Pattern correlation saved with ID: {doc_ref.id}")
+            doc_ref = (await self._pattern_correlations.add(clean_data))[1]
+            logger.info("Pattern correlation saved with ID: %s", doc_ref.id)
             return doc_ref.id
         except Exception as e:
             logger.error(f"Failed to save pattern correlation: {e}")
             return ""
             
-    def get_pattern_correlations(self, min_strength: float = 0.5) -> List[Dict[str, Any]]:
+    async def get_pattern_correlations(self, min_strength: float = 0.5) -> List[Dict[str, Any]]:
         """Get pattern correlations above minimum strength."""
         try:
-            docs = (self.db.collection('pattern_correlations')
-                   .where('correlation_strength', '>=', min_strength)
+            docs = (self._pattern_correlations
+                   .where(filter=FieldFilter('correlation_strength', '>=', min_strength))
                    .stream())
                    
             correlations = []
-            for doc in docs:
+            async for doc in docs:
                 corr_data = doc.to_dict()
                 corr_data['id'] = doc.id
                 correlations.append(corr_data)
@@ -5,9 +5,16 @@ Simplified interface to Aerodrome DEX using QuickNode's API.
 Replaces complex on-chain data collection with reliable API calls.
 """
 import aiohttp
+import copy
 import logging
-from typing import Dict, List, Optional, Tuple
-from decimal import Decimal
+import orjson
+import random
+import socket
+import time
+from collections import OrderedDict
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+from decimal import Decimal, InvalidOperation
 from datetime import datetime
 import asyncio
 
@@ -15,6 +22,115 @@ from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Retry policy for throttled or failing upstream calls
+MAX_RETRIES = 3
+RETRY_BACKOFF_BASE = 0.5  # seconds
+MAX_RETRY_AFTER = 60.0  # seconds; caps a server-supplied Retry-After
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Per-attempt limits; aiohttp's default is a 5 minute total with no connect bound
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10)
+
+# Cache lifetimes (seconds) per resource type
+CACHE_TTL = {
+    "pools": 30,
+    "pool_analytics": 60,
+}
+
+
+class APIRequestError(Exception):
+    """Non-retryable (or retry-exhausted) HTTP error from the API."""
+    
+    def __init__(self, status: int):
+        super().__init__(f"API request failed: {status}")
+        self.status = status
+
+
+def _json_default(obj):
+    """Send Decimals (e.g. quote amounts) as strings to keep full precision."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj) -> str:
+    """Serialize a request body with orjson."""
+    return orjson.dumps(obj, default=_json_default).decode()
+
+
+class _TTLCache:
+    """Small LRU cache whose entries expire after a per-entry TTL.
+    
+    Expired entries that carry an ETag are kept until evicted so the
+    caller can revalidate them with If-None-Match instead of refetching.
+    """
+    
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Tuple[float, Optional[str], Any]]" = OrderedDict()
+        
+    def get(self, key: str) -> Optional[Any]:
+        """Return a cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+            
+        expires_at, etag, value = entry
+        if time.monotonic() >= expires_at:
+            if etag is None:
+                del self._data[key]
+            return None
+            
+        self._data.move_to_end(key)
+        return value
+        
+    def get_stale(self, key: str) -> Optional[Tuple[str, Any]]:
+        """Return (etag, value) for an entry that can be revalidated."""
+        entry = self._data.get(key)
+        if entry is None or entry[1] is None:
+            return None
+        return entry[1], entry[2]
+        
+    def set(self, key: str, value: Any, ttl: float, etag: Optional[str] = None):
+        """Store a value for ttl seconds, evicting the least recently used entry."""
+        self._data[key] = (time.monotonic() + ttl, etag, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+class _TokenBucket:
+    """Token-bucket rate limiter for async callers.
+    
+    The lock only guards the bucket arithmetic; waiters sleep outside it
+    so concurrent callers are not serialized behind one sleeper.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError(f"Token bucket rate must be positive, got {rate}")
+        self.rate = rate  # tokens per second
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                    
+                wait = (1 - self._tokens) / self.rate
+                
+            await asyncio.sleep(wait)
+
 
 class AerodromeAPI:
     """
@@ -34,47 +150,149 @@ class AerodromeAPI:
             self.endpoint = "https://base-mainnet.g.alchemy.com/v2/"  # Will be replaced with actual QuickNode endpoint
             
         self.base_url = f"{self.endpoint}/addon/aerodrome/v1"
-        self.session = None
+        
+        # Request constants built once rather than per call
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate",  # Pool listings compress well
+        }
+        self._urls = {
+            endpoint: f"{self.base_url}{endpoint}"
+            for endpoint in ("/pools", "/swap/quote", "/swap/build", "/tokens/prices")
+        }
+        self._session: Optional[aiohttp.ClientSession] = None
         
         # Cache for frequently accessed data
-        self._cache = {}
-        self._cache_ttl = 30  # 30 seconds cache
+        self._cache = _TTLCache(maxsize=256)
+        
+        # Client-side rate limiting to stay under the provider quota;
+        # QUICKNODE_RATE_LIMIT <= 0 disables it
+        self._limiter: Optional[_TokenBucket] = None
+        if settings.quicknode_rate_limit > 0:
+            self._limiter = _TokenBucket(rate=settings.quicknode_rate_limit / 60)
+        
+        # Bound in-flight requests so fan-out can't exhaust the connector
+        self._http_sem = asyncio.Semaphore(16)
         
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
+        await self._get_session()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
-            await self.session.close()
-            
-    async def _request(self, method: str, endpoint: str, **kwargs) -> Dict:
-        """Make an authenticated request to the API."""
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        await self.close()
+        
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared session, creating it on first use.
+        
+        One pooled session is kept for the lifetime of the client so
+        keep-alive connections are reused instead of re-handshaking
+        on every request.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=16,
+                    use_dns_cache=True,
+                    ttl_dns_cache=600,  # Single API host; resolve it rarely
+                    family=socket.AF_INET,  # IPv4 only, avoids happy-eyeballs stalls
+                    keepalive_timeout=75
+                ),
+                # Static headers ride on the session instead of every request
+                headers=self._headers,
+                timeout=REQUEST_TIMEOUT,
+                # Encode request bodies in C, matching the orjson response parsing
+                json_serialize=_json_dumps
+            )
+        return self._session
+        
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
             
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+    async def _request(self, method: str, endpoint: str, cache_ttl: Optional[float] = None, **kwargs) -> Dict:
+        """Make an authenticated request to the API.
         
-        url = f"{self.base_url}{endpoint}"
+        When cache_ttl is given, successful responses are cached for that
+        many seconds, keyed by method, endpoint and query params. Callers
+        always get their own copy, so mutating a result can't corrupt the
+        cache.
+        """
+        cache_key = None
+        if cache_ttl:
+            params = kwargs.get("params") or {}
+            cache_key = f"{method} {endpoint}?{sorted(params.items())}"
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+                
+        # Revalidate an expired entry instead of downloading it again
+        headers = None
+        stale = self._cache.get_stale(cache_key) if cache_key else None
+        if stale:
+            headers = {"If-None-Match": stale[0]}
+            
+        session = await self._get_session()
+        url = self._urls.get(endpoint) or f"{self.base_url}{endpoint}"
         
         try:
-            async with self.session.request(method, url, headers=headers, **kwargs) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    error_text = await response.text()
-                    logger.error(f"API request failed: {response.status} - {error_text}")
-                    raise Exception(f"API request failed: {response.status}")
+            for attempt in range(MAX_RETRIES + 1):
+                if self._limiter:
+                    await self._limiter.acquire()
+                
+                try:
+                    async with self._http_sem, session.request(method, url, headers=headers, **kwargs) as response:
+                        if response.status == 200:
+                            # orjson parses the raw bytes directly, skipping the str decode
+                            data = orjson.loads(await response.read())
+                            if cache_key:
+                                self._cache.set(cache_key, data, cache_ttl, response.headers.get("ETag"))
+                                return copy.deepcopy(data)
+                            return data
+                        
+                        if response.status == 304 and stale:
+                            # Unchanged upstream - keep the cached body for another TTL
+                            self._cache.set(cache_key, stale[1], cache_ttl, stale[0])
+                            return copy.deepcopy(stale[1])
+                        
+                        if response.status not in RETRYABLE_STATUSES or attempt == MAX_RETRIES:
+                            error_text = await response.text()
+                            logger.error(f"API request failed: {response.status} - {error_text}")
+                            raise APIRequestError(response.status)
+                        
+                        # Discard the error body unread so the connection goes straight back to the pool
+                        response.release()
+                        delay = self._retry_delay(attempt, response.headers.get("Retry-After"))
+                        logger.warning(f"API returned {response.status} for {endpoint}, retrying in {delay:.1f}s")
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    # Dropped connections and timeouts are transient too
+                    if attempt == MAX_RETRIES:
+                        raise
+                    delay = self._retry_delay(attempt)
+                    logger.warning(f"API connection error for {endpoint} ({e!r}), retrying in {delay:.1f}s")
                     
+                # Back off outside the semaphore so other requests can proceed
+                await asyncio.sleep(delay)
+                
         except Exception as e:
             logger.error(f"Request error: {e}")
             raise
             
+    @staticmethod
+    def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+        """Exponential backoff with full jitter, honouring Retry-After up to MAX_RETRY_AFTER."""
+        if retry_after:
+            try:
+                return min(MAX_RETRY_AFTER, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+        return random.uniform(0, RETRY_BACKOFF_BASE * (2 ** attempt))
+            
     async def get_pools(self, 
                        token0: Optional[str] = None,
                        token1: Optional[str] = None,
@@ -92,6 +310,17 @@ class AerodromeAPI:
         Returns:
             List of pool data dictionaries
         """
+        raw_pools = await self._get_raw_pools(token0, token1, min_tvl, sort_by)
+        
+        # Transform to our expected format
+        return [self._transform_pool(pool) for pool in raw_pools]
+        
+    async def _get_raw_pools(self,
+                             token0: Optional[str] = None,
+                             token1: Optional[str] = None,
+                             min_tvl: Optional[float] = None,
+                             sort_by: str = "apr") -> List[Dict]:
+        """Fetch the pool list as returned by the API, without conversion."""
         params = {}
         if token0:
             params["token0"] = token0
@@ -101,32 +330,34 @@ class AerodromeAPI:
             params["minTvl"] = min_tvl
         params["sortBy"] = sort_by
         
-        data = await self._request("GET", "/pools", params=params)
+        data = await self._request("GET", "/pools", cache_ttl=CACHE_TTL["pools"], params=params)
+        return data.get("pools", [])
         
-        # Transform to our expected format
-        pools = []
-        for pool in data.get("pools", []):
-            pools.append({
-                "address": pool["address"],
-                "pair": f"{pool['token0Symbol']}/{pool['token1Symbol']}",
-                "token0": pool["token0"],
-                "token1": pool["token1"],
-                "stable": pool["stable"],
-                "tvl": Decimal(str(pool["tvlUSD"])),
-                "volume_24h": Decimal(str(pool["volume24hUSD"])),
-                "apr": Decimal(str(pool["apr"])),
-                "fee_apr": Decimal(str(pool["feeApr"])),
-                "incentive_apr": Decimal(str(pool["incentiveApr"])),
-                "reserves": {
-                    pool["token0Symbol"]: Decimal(str(pool["reserve0"])),
-                    pool["token1Symbol"]: Decimal(str(pool["reserve1"]))
-                },
-                "ratio": Decimal(str(pool["reserve1"])) / Decimal(str(pool["reserve0"])) if Decimal(str(pool["reserve0"])) > 0 else Decimal("0"),
-                "gauge": pool.get("gauge"),
-                "emissions": Decimal(str(pool.get("emissionsUSD", "0")))
-            })
-            
-        return pools
+    @staticmethod
+    def _transform_pool(pool: Dict) -> Dict:
+        """Convert a raw API pool record to our pool format."""
+        # Parse each reserve once; they feed both the reserves map and the ratio
+        reserve0 = Decimal(str(pool["reserve0"]))
+        reserve1 = Decimal(str(pool["reserve1"]))
+        return {
+            "address": pool["address"],
+            "pair": f"{pool['token0Symbol']}/{pool['token1Symbol']}",
+            "token0": pool["token0"],
+            "token1": pool["token1"],
+            "stable": pool["stable"],
+            "tvl": Decimal(str(pool["tvlUSD"])),
+            "volume_24h": Decimal(str(pool["volume24hUSD"])),
+            "apr": Decimal(str(pool["apr"])),
+            "fee_apr": Decimal(str(pool["feeApr"])),
+            "incentive_apr": Decimal(str(pool["incentiveApr"])),
+            "reserves": {
+                pool["token0Symbol"]: reserve0,
+                pool["token1Symbol"]: reserve1
+            },
+            "ratio": reserve1 / reserve0 if reserve0 > 0 else Decimal("0"),
+            "gauge": pool.get("gauge"),
+            "emissions": Decimal(str(pool.get("emissionsUSD", "0")))
+        }
         
     async def get_pool_analytics(self, pool_address: str) -> Dict:
         """
@@ -138,7 +369,9 @@ class AerodromeAPI:
         Returns:
             Detailed pool analytics including historical data
         """
-        data = await self._request("GET", f"/pools/{pool_address}/analytics")
+        data = await self._request(
+            "GET", f"/pools/{pool_address}/analytics", cache_ttl=CACHE_TTL["pool_analytics"]
+        )
         
         return {
             "current": {
@@ -249,18 +482,21 @@ class AerodromeAPI:
         Returns:
             List of opportunity pools sorted by APR
         """
-        pools = await self.get_pools(min_tvl=min_tvl, sort_by="apr")
+        raw_pools = await self._get_raw_pools(min_tvl=min_tvl, sort_by="apr")
         
         opportunities = []
-        for pool in pools:
-            if pool["apr"] >= min_apr:
-                if not stable_only or pool["stable"]:
-                    opportunities.append({
-                        **pool,
-                        "opportunity_score": float(pool["apr"]) * (1 + min(pool["tvl"] / 1000000, 1))
-                    })
-                    
-        return sorted(opportunities, key=lambda x: x["opportunity_score"], reverse=True)
+        for raw in raw_pools:
+            # Filter on the raw fields before paying for the Decimal conversion
+            if float(raw["apr"]) < min_apr or (stable_only and not raw["stable"]):
+                continue
+                
+            pool = self._transform_pool(raw)
+            opportunities.append({
+                **pool,
+                "opportunity_score": float(pool["apr"]) * (1 + min(pool["tvl"] / 1000000, 1))
+            })
+            
+        return sorted(opportunities, key=itemgetter("opportunity_score"), reverse=True)
         
     async def get_rebalance_opportunities(self, 
                                         current_positions: List[Dict],
@@ -296,7 +532,7 @@ class AerodromeAPI:
                         "to_pool_data": pool
                     })
                     
-        return sorted(suggestions, key=lambda x: x["apr_improvement"], reverse=True)
+        return sorted(suggestions, key=itemgetter("apr_improvement"), reverse=True)
         
     async def estimate_compound_roi(self,
                                   pool_address: str,
@@ -313,18 +549,26 @@ class AerodromeAPI:
         Returns:
             ROI analysis for compounding
         """
-        # Get pool data
-        pools = await self.get_pools()
-        pool = next((p for p in pools if p["address"] == pool_address), None)
-        
-        if not pool:
+        # Fetch just this pool rather than the whole pool list, and convert
+        # only the APR instead of the full analytics history
+        try:
+            data = await self._request(
+                "GET", f"/pools/{pool_address}/analytics", cache_ttl=CACHE_TTL["pool_analytics"]
+            )
+            apr = Decimal(str(data["current"]["apr"]))
+        except APIRequestError as e:
+            # Only a 404 means the pool is unknown; other failures propagate
+            if e.status != 404:
+                raise
             return {"profitable": False, "reason": "Pool not found"}
+        except (KeyError, TypeError, InvalidOperation):
+            return {"profitable": False, "reason": "Pool data unavailable"}
             
         # Estimate gas cost (compound typically uses ~200k gas)
         gas_cost_usd = (gas_price * 200000 / 10**9) * 2300  # Assume ETH = $2300
         
         # Calculate daily earnings from compounded rewards
-        daily_earnings = pending_rewards * pool["apr"] / 36500
+        daily_earnings = pending_rewards * apr / 36500
         
         # Days to break even
         breakeven_days = float(gas_cost_usd / daily_earnings) if daily_earnings > 0 else 999